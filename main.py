@@ -1,5 +1,14 @@
 import os
 import gradio as gr
+
+# uvloop speeds up the I/O-bound aiohttp fan-out noticeably; install it
+# before any event loop is created, and run without it where unavailable.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 from src.ui.gradio_app import create_gradio_interface
 from src.utils.config import Config
 
@@ -13,6 +22,7 @@ def main():
     if config.llm_provider == "ollama":
         print(f"📡 Ollama URL: {config.ollama_base_url}")
         print(f"🤖 Ollama Model: {config.ollama_model_name}")
+        print(f"⚡ Ollama Parallel Requests: {config.ollama_num_parallel}")
     elif config.llm_provider == "gemini":
         print(f"🔑 Gemini API Key: {'Set' if config.gemini_api_key else 'Not Set'}")
         print(f"🤖 Gemini Model: {config.gemini_model_name}")
@@ -1,3 +1,4 @@
+import re
 import tiktoken
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
@@ -102,32 +103,90 @@ class TextChunker:
     def chunk_by_sentences(self, text: str) -> List[TextChunk]:
         """
         Chunk text by sentences, respecting token limits.
-        
+
         Args:
             text: Input text to chunk
-            
+
         Returns:
             List of TextChunk objects
         """
-        import re
-        
         # Split into sentences using regex
         sentence_endings = r'[.!?]+\s+'
         sentences = re.split(sentence_endings, text)
-        
-        chunks = []
+
+        return list(self._iter_packed_chunks(sentences))
+
+    def chunk_recursive(self, text: str) -> List[TextChunk]:
+        """
+        Chunk text by recursively splitting on paragraph, sentence, then word
+        boundaries.
+
+        Splitting at the coarsest boundary that fits the token budget keeps
+        semantically related sentences together and usually produces fewer
+        chunks than sentence-only splitting, which means fewer LLM calls.
+
+        Args:
+            text: Input text to chunk
+
+        Returns:
+            List of TextChunk objects
+        """
+        if not text.strip():
+            return []
+
+        units = self._split_units(text, ["\n\n", "\n", ". ", "? ", "! ", " "])
+        return list(self._iter_packed_chunks(units))
+
+    def _split_units(self, text: str, separators: List[str]) -> List[str]:
+        """
+        Recursively split text into units that fit the token budget.
+
+        Tries the coarsest separator first and only descends to finer ones
+        for pieces that are still over the chunk size.
+
+        Args:
+            text: Text to split
+            separators: Separators ordered from coarsest to finest
+
+        Returns:
+            List of text units, each within the chunk token budget
+        """
+        if not separators:
+            return [text]
+
+        sep = separators[0]
+        parts = [part for part in text.split(sep) if part.strip()]
+
+        units = []
+        for part in parts:
+            if len(self.tokenizer.encode(part)) > self.chunk_size:
+                units.extend(self._split_units(part, separators[1:]))
+            else:
+                units.append(part)
+        return units
+
+    def _iter_packed_chunks(self, units: List[str]):
+        """
+        Greedily pack text units into token-capped chunks with overlap.
+
+        Args:
+            units: Text units (sentences, paragraphs, ...) in document order
+
+        Yields:
+            TextChunk objects in order
+        """
         current_chunk = ""
         current_tokens = 0
         chunk_id = 0
         start_index = 0
-        
-        for sentence in sentences:
+
+        for sentence in units:
             sentence = sentence.strip()
             if not sentence:
                 continue
-            
+
             sentence_tokens = len(self.tokenizer.encode(sentence))
-            
+
             # If adding this sentence would exceed the limit, create a new chunk
             if current_tokens + sentence_tokens > self.chunk_size and current_chunk:
                 chunk = TextChunk(
@@ -137,8 +196,8 @@ class TextChunker:
                     token_count=current_tokens,
                     chunk_id=chunk_id
                 )
-                chunks.append(chunk)
-                
+                yield chunk
+
                 # Start new chunk with overlap
                 overlap_text = self._get_overlap_text(current_chunk)
                 current_chunk = overlap_text + " " + sentence
@@ -152,19 +211,16 @@ class TextChunker:
                 else:
                     current_chunk = sentence
                 current_tokens = len(self.tokenizer.encode(current_chunk))
-        
+
         # Add the last chunk
         if current_chunk.strip():
-            chunk = TextChunk(
+            yield TextChunk(
                 content=current_chunk.strip(),
                 start_index=start_index,
                 end_index=start_index + len(current_chunk),
                 token_count=current_tokens,
                 chunk_id=chunk_id
             )
-            chunks.append(chunk)
-        
-        return chunks
     
     def _adjust_chunk_boundary(self, text: str) -> str:
         """
@@ -177,7 +233,6 @@ class TextChunker:
             Adjusted text
         """
         # Try to find the last sentence ending
-        import re
         sentence_endings = ['.', '!', '?']
         
         for i in range(len(text) - 1, -1, -1):
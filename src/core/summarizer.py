@@ -1,14 +1,21 @@
 import asyncio
+import hashlib
+import io
 import logging
-from typing import List, Dict, Any, Optional, TypedDict
-from dataclasses import dataclass
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import AsyncIterator, List, Dict, Any, Optional, Union
+from dataclasses import dataclass, field
 import time
 from concurrent.futures import ThreadPoolExecutor
 from uuid import uuid4
 
-from langchain_core.documents import Document
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langgraph.graph import StateGraph, START, END
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
 
 from ..core.vtt_parser import VTTParser, TranscriptSegment
 from ..core.chunker import TextChunker, TextChunk
@@ -22,17 +29,51 @@ log_level = getattr(logging, config_instance.log_level.upper(), logging.INFO)
 logging.basicConfig(level=log_level)
 logger = logging.getLogger(__name__)
 
-class SummarizationState(TypedDict):
-    """State for the summarization workflow."""
-    original_text: str
-    chunks: Optional[List[TextChunk]]
-    chunk_summaries: Optional[List[str]]
-    final_summary: str
-    processing_stats: Optional[Dict[str, Any]]
-    error: Optional[str]
-    # Add configuration tracking
-    debug_config: Optional[Dict[str, Any]]
-    original_file_name_base: str # Add this to the state
+# Maximum number of chunk summaries kept in the in-memory LRU cache
+CHUNK_CACHE_MAX_ENTRIES = 1024
+
+# Matches one whitespace-delimited word; used to count words without
+# allocating the full token list that str.split() would build.
+_WORD_RE = re.compile(r"\S+")
+
+# Strips leftover VTT artifacts — numeric cue identifiers, timing lines,
+# and inline markup tags — that inflate token count without adding meaning.
+_VTT_NOISE = re.compile(r"^\d+\s*$|^\d{2}:\d{2}:\d{2}\.\d+ -->.*$|<[^>]+>", re.MULTILINE)
+
+def _strip_vtt_noise(text: str) -> str:
+    """Remove VTT cue/timing/markup noise in one C-level regex pass."""
+    return _VTT_NOISE.sub("", text)
+
+def _count_words(text: str) -> int:
+    """Count whitespace-delimited words without materializing a list."""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+def _combine_summaries(summaries: List[str]) -> str:
+    """Concatenate summaries separated by blank lines via an incremental buffer."""
+    buf = io.StringIO()
+    for i, summary in enumerate(summaries):
+        if i:
+            buf.write("\n\n")
+        buf.write(summary)
+    return buf.getvalue()
+
+@dataclass(slots=True)
+class SummarizationState:
+    """State for the summarization pipeline, mutated in place by each stage.
+
+    Stages null out fields they no longer need (original_text after
+    chunking, chunks after chunk summarization) so a long transcript is
+    not held in memory three times over for the whole pipeline.
+    """
+    original_text: Optional[str]
+    original_file_name_base: str = "uploaded_transcript"
+    chunks: Optional[List[TextChunk]] = None
+    chunk_summaries: Optional[List[str]] = None
+    final_summary: str = ""
+    processing_stats: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    # Configuration tracking for debug logging
+    debug_config: Optional[Dict[str, Any]] = None
 
 @dataclass
 class SummarizationResult:
@@ -46,7 +87,7 @@ class SummarizationResult:
     error: Optional[str] = None
 
 class TranscriptSummarizer:
-    """Main summarizer class using LangGraph for workflow orchestration."""
+    """Main summarizer class running the summarization pipeline as straight-line async calls."""
     
     def __init__(self, config: Config):
         """
@@ -66,13 +107,44 @@ class TranscriptSummarizer:
         logger.info(f"📊 Initial Config - Gemini Model: {config.gemini_model_name}")
         
         self.llm_service = self._initialize_llm_service(config)
-        self.chunker = TextChunker(
-            chunk_size=config.chunk_size,
-            overlap_size=config.chunk_overlap
-        )
+        # Chunkers are cached per (chunk_size, overlap) so slider tweaks in
+        # the UI only pay the tiktoken tokenizer load for new combinations.
+        self._chunker_cache: Dict[tuple, TextChunker] = {}
+        self.chunker = self._get_chunker(config.chunk_size, config.chunk_overlap)
         self.vtt_parser = VTTParser()
-        self.workflow = self._create_workflow()
-    
+        # LRU cache of chunk summaries keyed by (model, temperature, prompt)
+        # hash, so re-running or appending to a transcript only summarizes
+        # chunks the model has not seen before.
+        self._chunk_cache: "OrderedDict[str, str]" = OrderedDict()
+        # Optional Redis L2 cache so multiple worker processes share
+        # completed chunk summaries; per-instance OrderedDict stays the L1.
+        self._redis = None
+        if config.redis_url:
+            if aioredis is None:
+                logger.warning("🗄️ CACHE DEBUG: REDIS_URL set but the 'redis' package is not installed; shared cache disabled")
+            else:
+                self._redis = aioredis.from_url(config.redis_url, decode_responses=True)
+                logger.info(f"🗄️ CACHE DEBUG: Shared chunk-summary cache enabled at {config.redis_url}")
+
+        # Warm the model in the background so the first summarize request
+        # does not pay the cold model-load cost.
+        if config.warmup_on_start and hasattr(self.llm_service, "warmup"):
+            threading.Thread(
+                target=self._warmup_llm_service,
+                name="llm-warmup",
+                daemon=True
+            ).start()
+
+    def _warmup_llm_service(self):
+        """Best-effort model warm-up; failures are logged, never raised."""
+        try:
+            if self.llm_service.warmup():
+                logger.info("🔥 WARMUP DEBUG: Model warmed up and ready")
+            else:
+                logger.warning("🔥 WARMUP DEBUG: Model warm-up request did not succeed")
+        except Exception as e:
+            logger.warning(f"🔥 WARMUP DEBUG: Model warm-up failed - {e}")
+
     def _initialize_llm_service(self, config: Config):
         """Initialize the appropriate LLM service based on configuration."""
         if config.llm_provider == "ollama":
@@ -80,7 +152,8 @@ class TranscriptSummarizer:
             return OllamaService(
                 base_url=config.ollama_base_url,
                 model=config.ollama_model_name,
-                timeout=config.request_timeout
+                timeout=config.request_timeout,
+                num_parallel=config.ollama_num_parallel
             )
         elif config.llm_provider == "gemini":
             if not config.gemini_api_key:
@@ -89,7 +162,8 @@ class TranscriptSummarizer:
             return GeminiService(
                 api_key=config.gemini_api_key,
                 model=config.gemini_model_name,
-                timeout=config.request_timeout
+                timeout=config.request_timeout,
+                max_concurrent=config.max_concurrent_requests
             )
         else:
             raise ValueError(f"Unsupported LLM provider: {config.llm_provider}")
@@ -117,231 +191,415 @@ class TranscriptSummarizer:
         logger.info(f"📊 NEW Config - Chunk Size: {self.config.chunk_size}")
         logger.info(f"📊 NEW Config - Chunk Overlap: {self.config.chunk_overlap}")
         
-        # Recreate chunker with new settings
-        self.chunker = TextChunker(
-            chunk_size=chunk_size,
-            overlap_size=chunk_overlap
-        )
-        logger.info("🔄 CONFIG UPDATE DEBUG: Chunker recreated with new settings")
+        # Reuse a cached chunker when this configuration was seen before
+        self.chunker = self._get_chunker(chunk_size, chunk_overlap)
+        logger.info("🔄 CONFIG UPDATE DEBUG: Chunker set for new settings")
         # Re-initialize LLM service if model name or provider changes (not handled by this update_config)
         # For now, assume model/provider changes require full re-initialization of Summarizer
     
-    def _create_workflow(self):
-        """Create the LangGraph workflow for summarization."""
+    def _get_chunker(self, chunk_size: int, chunk_overlap: int) -> TextChunker:
+        """Return the cached TextChunker for this configuration, creating it once."""
+        key = (chunk_size, chunk_overlap)
+        chunker = self._chunker_cache.get(key)
+        if chunker is None:
+            chunker = TextChunker(chunk_size=chunk_size, overlap_size=chunk_overlap)
+            self._chunker_cache[key] = chunker
+        return chunker
+
+    async def _parse_input(self, state: SummarizationState) -> SummarizationState:
+        """Parse and validate input."""
+        logger.info("🏁 PIPELINE DEBUG: Starting parse_input")
+        if not state.original_text.strip():
+            logger.error("❌ PIPELINE DEBUG: Empty input text")
+            state.error = "Empty input text"
+            return state
+
+        # Initialize processing stats. Encoding the full transcript with
+        # tiktoken takes long enough on big inputs to stall other in-flight
+        # requests, so it runs in a worker thread like the chunking pass.
+        state.processing_stats = {
+            "start_time": time.time(),
+            "original_length": len(state.original_text),
+            "original_words": _count_words(state.original_text),
+            "original_tokens": await asyncio.to_thread(self._count_tokens, state.original_text)
+        }
         
-        def parse_input(state: SummarizationState) -> SummarizationState:
-            """Parse and validate input."""
-            logger.info("🏁 WORKFLOW DEBUG: Starting parse_input node")
-            if not state.get("original_text", "").strip():
-                logger.error("❌ WORKFLOW DEBUG: Empty input text")
-                return {**state, "error": "Empty input text"}
-            
-            # Initialize processing stats
-            processing_stats = {
-                "start_time": time.time(),
-                "original_length": len(state["original_text"]),
-                "original_words": len(state["original_text"].split())
-            }
+        # Add debug config to state
+        debug_config = {
+            "temperature": self.config.temperature,
+            "chunk_size": self.config.chunk_size,
+            "chunk_overlap": self.config.chunk_overlap,
+            "llm_provider": self.config.llm_provider,
+            "model_name": self.config.ollama_model_name if self.config.llm_provider == "ollama" else self.config.gemini_model_name
+        }
+        
+        logger.info(f"🐛 PIPELINE DEBUG: Configuration in parse_input - {debug_config}")
+        
+        state.debug_config = debug_config
+        return state
+    
+    async def _chunk_text(self, state: SummarizationState) -> SummarizationState:
+        """Chunk the text for processing."""
+        logger.info("✂️ PIPELINE DEBUG: Starting chunk_text")
+        debug_config = state.debug_config or {}
+        logger.info(f"🐛 PIPELINE DEBUG: Using chunk_size={debug_config.get('chunk_size')} and chunk_overlap={debug_config.get('chunk_overlap')}")
+        
+        if state.error:
+            return state
+        
+        try:
+            # Log current chunker configuration
+            logger.info(f"🔧 CHUNKER DEBUG: Chunker configured with size={self.chunker.chunk_size}, overlap={self.chunker.overlap_size}")
             
-            # Add debug config to state
-            debug_config = {
-                "temperature": self.config.temperature,
-                "chunk_size": self.config.chunk_size,
-                "chunk_overlap": self.config.chunk_overlap,
-                "llm_provider": self.config.llm_provider,
-                "model_name": self.config.ollama_model_name if self.config.llm_provider == "ollama" else self.config.gemini_model_name
-            }
+            # Tokenizer-heavy chunking runs in a worker thread so the
+            # event loop stays responsive for other in-flight requests
+            chunks = await asyncio.to_thread(self.chunker.chunk_recursive, state.original_text)
+            logger.info(f"📊 CHUNKER DEBUG: Created {len(chunks)} chunks")
             
-            logger.info(f"🐛 WORKFLOW DEBUG: Configuration in parse_input - {debug_config}")
+            # Log chunk details
+            for i, chunk in enumerate(chunks):
+                logger.info(f"📄 CHUNK {i+1} DEBUG: {chunk.token_count} tokens, first 100 chars: {chunk.content[:100]}...")
             
-            return {**state, "processing_stats": processing_stats, "debug_config": debug_config}
-        
-        def chunk_text(state: SummarizationState) -> SummarizationState:
-            """Chunk the text for processing."""
-            logger.info("✂️ WORKFLOW DEBUG: Starting chunk_text node")
-            debug_config = state.get("debug_config", {})
-            logger.info(f"🐛 WORKFLOW DEBUG: Using chunk_size={debug_config.get('chunk_size')} and chunk_overlap={debug_config.get('chunk_overlap')}")
+            processing_stats = state.processing_stats
+            processing_stats.update({
+                "chunks_created": len(chunks),
+                "chunking_strategy": "recursive",
+                "actual_chunk_size_used": self.chunker.chunk_size,
+                "actual_overlap_used": self.chunker.overlap_size
+            })
             
-            if state.get("error"):
-                return state
+            # If only one chunk, the final merge pass is unnecessary
+            if len(chunks) == 1:
+                processing_stats["single_chunk"] = True
+                logger.info("📝 CHUNKER DEBUG: Single chunk detected, will skip final merge")
             
-            try:
-                # Log current chunker configuration
-                logger.info(f"🔧 CHUNKER DEBUG: Chunker configured with size={self.chunker.chunk_size}, overlap={self.chunker.overlap_size}")
-                
-                chunks = self.chunker.chunk_by_sentences(state["original_text"])
-                logger.info(f"📊 CHUNKER DEBUG: Created {len(chunks)} chunks")
-                
-                # Log chunk details
-                for i, chunk in enumerate(chunks):
-                    logger.info(f"📄 CHUNK {i+1} DEBUG: {chunk.token_count} tokens, first 100 chars: {chunk.content[:100]}...")
-                
-                processing_stats = state.get("processing_stats", {})
-                processing_stats.update({
-                    "chunks_created": len(chunks),
-                    "chunking_strategy": "sentence-based",
-                    "actual_chunk_size_used": self.chunker.chunk_size,
-                    "actual_overlap_used": self.chunker.overlap_size
-                })
-                
-                # If only one chunk, we might not need chunk-level summarization
-                if len(chunks) == 1:
-                    processing_stats["single_chunk"] = True
-                    logger.info("📝 CHUNKER DEBUG: Single chunk detected, will skip chunk summarization")
-                
-                return {**state, "chunks": chunks, "processing_stats": processing_stats}
-                
-            except Exception as e:
-                logger.error(f"❌ CHUNKER DEBUG: Error in chunking - {str(e)}")
-                return {**state, "error": f"Error chunking text: {str(e)}"}
+            state.chunks = chunks
+            # The text now lives in the chunks (plus overlap); dropping the
+            # original halves peak memory for the rest of the pipeline.
+            state.original_text = None
+            return state
+
+        except Exception as e:
+            logger.error(f"❌ CHUNKER DEBUG: Error in chunking - {str(e)}")
+            state.error = f"Error chunking text: {str(e)}"
+            return state
+    
+    async def _summarize_chunks(self, state: SummarizationState) -> SummarizationState:
+        """Summarize individual chunks."""
+        logger.info("📝 PIPELINE DEBUG: Starting summarize_chunks")
+        debug_config = state.debug_config or {}
+        logger.info(f"🐛 PIPELINE DEBUG: Using temperature={debug_config.get('temperature')} for chunk summarization")
         
-        async def summarize_chunks(state: SummarizationState) -> SummarizationState:
-            """Summarize individual chunks."""
-            logger.info("📝 WORKFLOW DEBUG: Starting summarize_chunks node")
-            debug_config = state.get("debug_config", {})
-            logger.info(f"🐛 WORKFLOW DEBUG: Using temperature={debug_config.get('temperature')} for chunk summarization")
-            
-            if state.get("error") or not state.get("chunks"):
+        if state.error or not state.chunks:
+            return state
+        
+        try:
+            chunks = state.chunks
+
+            # Medium-length inputs: fold map and reduce into one structured
+            # prompt, so a handful of chunks costs a single LLM call instead
+            # of N chunk calls plus a merge. Chunks are already capped at
+            # chunk_size tokens, so fuse_threshold bounds the prompt size.
+            if 2 <= len(chunks) <= self.config.fuse_threshold:
+                logger.info(f"🔗 FUSE DEBUG: Summarizing {len(chunks)} chunks in one fused map-reduce call")
+                fused_prompt = self._create_fused_prompt([chunk.content for chunk in chunks])
+                response = await self.llm_service.generate_async(
+                    prompt=fused_prompt,
+                    temperature=self.config.temperature
+                )
+                state.processing_stats["chunks_summarized"] = len(chunks)
+                state.processing_stats["fused_map_reduce"] = True
+                state.processing_stats["temperature_used"] = self.config.temperature
+                # A single fused summary needs no cross-chunk merge pass
+                state.chunk_summaries = [response.content.strip()]
+                state.chunks = None
                 return state
+
+            # Log temperature being used
+            logger.info(f"🌡️ TEMPERATURE DEBUG: About to call LLM service with temperature={self.config.temperature}")
+
+            # Process chunks asynchronously
+            chunk_summaries = await self._process_chunks_async(chunks)
             
-            try:
-                chunks = state["chunks"]
-                
-                # If only one chunk, skip chunk summarization
-                if len(chunks) == 1:
-                    logger.info("📝 CHUNK SUMMARY DEBUG: Single chunk, using original content")
-                    return {**state, "chunk_summaries": [chunks[0].content]}
-                
-                # Create prompts for each chunk
-                chunk_prompts = []
-                for i, chunk in enumerate(chunks):
-                    prompt = self._create_chunk_summary_prompt(chunk.content, i + 1, len(chunks))
-                    chunk_prompts.append(prompt)
-                    logger.info(f"📄 PROMPT DEBUG: Created prompt for chunk {i+1}, prompt length: {len(prompt)} chars")
-                
-                # Log temperature being used
-                logger.info(f"🌡️ TEMPERATURE DEBUG: About to call LLM service with temperature={self.config.temperature}")
-                
-                # Process chunks asynchronously
-                chunk_summaries = await self._process_chunks_async(chunk_prompts)
-                
-                # Log results
-                for i, summary in enumerate(chunk_summaries):
-                    logger.info(f"📄 SUMMARY {i+1} DEBUG: {len(summary)} chars, first 100 chars: {summary[:100]}...")
-                
-                processing_stats = state.get("processing_stats", {})
-                processing_stats["chunks_summarized"] = len(chunk_summaries)
-                processing_stats["temperature_used"] = self.config.temperature
-                
-                return {**state, "chunk_summaries": chunk_summaries, "processing_stats": processing_stats}
-                
-            except Exception as e:
-                logger.error(f"❌ CHUNK SUMMARY DEBUG: Error in chunk summarization - {str(e)}")
-                return {**state, "error": f"Error summarizing chunks: {str(e)}"}
-        
-        def create_final_summary(state: SummarizationState) -> SummarizationState:
-            """Create the final summary from chunk summaries."""
-            logger.info("🎯 WORKFLOW DEBUG: Starting create_final_summary node")
-            debug_config = state.get("debug_config", {})
-            logger.info(f"🐛 WORKFLOW DEBUG: Using temperature={debug_config.get('temperature')} for final summary")
+            # Log results
+            for i, summary in enumerate(chunk_summaries):
+                logger.info(f"📄 SUMMARY {i+1} DEBUG: {len(summary)} chars, first 100 chars: {summary[:100]}...")
             
-            if state.get("error") or not state.get("chunk_summaries"):
-                return state
+            state.processing_stats["chunks_summarized"] = len(chunk_summaries)
+            state.processing_stats["temperature_used"] = self.config.temperature
             
-            try:
-                # Combine chunk summaries
-                combined_summaries = "\n\n".join(state["chunk_summaries"])
-                logger.info(f"📄 FINAL SUMMARY DEBUG: Combined summaries length: {len(combined_summaries)} chars")
-                
+            state.chunk_summaries = chunk_summaries
+            # Only the summaries are needed from here on; release the chunks
+            state.chunks = None
+            return state
+
+        except Exception as e:
+            logger.error(f"❌ CHUNK SUMMARY DEBUG: Error in chunk summarization - {str(e)}")
+            state.error = f"Error summarizing chunks: {str(e)}"
+            return state
+    
+    async def _create_final_summary(self, state: SummarizationState) -> SummarizationState:
+        """Create the final summary from chunk summaries."""
+        logger.info("🎯 PIPELINE DEBUG: Starting create_final_summary")
+        debug_config = state.debug_config or {}
+        logger.info(f"🐛 PIPELINE DEBUG: Using temperature={debug_config.get('temperature')} for final summary")
+        
+        if state.error or not state.chunk_summaries:
+            return state
+        
+        try:
+            # Tree-reduce first so the final merge prompt stays within
+            # the model's context window for long transcripts.
+            chunk_summaries = await self._collapse_summary_levels(state.chunk_summaries)
+
+            # Combine chunk summaries
+            combined_summaries = _combine_summaries(chunk_summaries)
+            logger.info(f"📄 FINAL SUMMARY DEBUG: Combined summaries length: {len(combined_summaries)} chars")
+
+            if len(chunk_summaries) < self.config.min_chunks_for_final_merge:
+                # Too few summaries to need cross-chunk integration; the
+                # chunk summaries already are the final summary.
+                logger.info("📝 FINAL SUMMARY DEBUG: Below merge threshold, skipping final LLM call")
+                final_summary = combined_summaries.strip()
+            else:
                 # Create final summary prompt
                 final_prompt = self._create_final_summary_prompt(combined_summaries)
                 logger.info(f"📄 FINAL PROMPT DEBUG: Final prompt length: {len(final_prompt)} chars")
-                
+
                 # Log temperature being used
                 logger.info(f"🌡️ FINAL TEMPERATURE DEBUG: About to call LLM service with temperature={self.config.temperature}")
-                
-                # Generate final summary
-                response = self.llm_service.generate_sync(
+
+                # Generate final summary without blocking the event loop
+                response = await self.llm_service.generate_async(
                     prompt=final_prompt,
                     temperature=self.config.temperature,
                 )
-                
+
                 final_summary = response.content.strip()
-                logger.info(f"📄 FINAL RESULT DEBUG: Final summary length: {len(final_summary)} chars")
-                logger.info(f"📄 FINAL RESULT DEBUG: First 200 chars: {final_summary}...")
-                
-                output_dir = "output"
-                import os
-                os.makedirs(output_dir, exist_ok=True)
-                
-                # output with timestamp and original file name
-                original_file_name_base = state.get("original_file_name_base", "uploaded_transcript")
-                timestamp = time.strftime("%Y%m%d_%H%M%S")
-                output_file = os.path.join(output_dir, f"{original_file_name_base}_summary_{timestamp}.md")                
-                with open(output_file, "w", encoding="utf-8") as f:
-                    f.write(final_summary)
-                
-                # Update processing stats
-                processing_stats = state.get("processing_stats", {})
-                end_time = time.time()
-                processing_time = end_time - processing_stats.get("start_time", 0)
-                
-                processing_stats.update({
-                    "end_time": end_time,
-                    "processing_time": processing_time,
-                    "final_summary_length": len(final_summary),
-                    "final_summary_words": len(final_summary.split()),
-                    "compression_ratio": len(state["original_text"]) / len(final_summary) if final_summary else 0,
-                    "final_temperature_used": self.config.temperature
-                })
-                
-                logger.info(f"⏱️ TIMING DEBUG: Total processing time: {processing_time:.2f} seconds")
-                logger.info(f"📊 COMPRESSION DEBUG: Compression ratio: {processing_stats['compression_ratio']:.2f}x")
-                
-                return {**state, "final_summary": final_summary, "processing_stats": processing_stats}
-                
-            except Exception as e:
-                logger.error(f"❌ FINAL SUMMARY DEBUG: Error in final summary creation - {str(e)}")
-                return {**state, "error": f"Error creating final summary: {str(e)}"}
-        
-        # Create the workflow graph
-        workflow = StateGraph(SummarizationState)
-        
-        # Add nodes
-        workflow.add_node("parse_input", parse_input)
-        workflow.add_node("chunk_text", chunk_text)
-        workflow.add_node("summarize_chunks", summarize_chunks)
-        workflow.add_node("create_final_summary", create_final_summary)
-        
-        # Define the workflow
-        workflow.add_edge(START, "parse_input")
-        workflow.add_edge("parse_input", "chunk_text")
-        workflow.add_edge("chunk_text", "summarize_chunks")
-        workflow.add_edge("summarize_chunks", "create_final_summary")
-        workflow.add_edge("create_final_summary", END)
-        
-        return workflow.compile()
+            logger.info(f"📄 FINAL RESULT DEBUG: Final summary length: {len(final_summary)} chars")
+            logger.info(f"📄 FINAL RESULT DEBUG: First 200 chars: {final_summary}...")
+            
+            self._write_summary_file(final_summary, state.original_file_name_base)
+            
+            # Update processing stats
+            processing_stats = state.processing_stats
+            end_time = time.time()
+            processing_time = end_time - processing_stats.get("start_time", 0)
+            
+            final_summary_tokens = self._count_tokens(final_summary)
+            original_tokens = processing_stats.get("original_tokens", 0)
+            processing_stats.update({
+                "end_time": end_time,
+                "processing_time": processing_time,
+                "final_summary_length": len(final_summary),
+                "final_summary_words": _count_words(final_summary),
+                "final_summary_tokens": final_summary_tokens,
+                # Token-based ratio reflects actual model usage, unlike
+                # character counts which the server re-tokenizes anyway
+                "compression_ratio": original_tokens / final_summary_tokens if final_summary_tokens else 0,
+                "final_temperature_used": self.config.temperature
+            })
+            
+            logger.info(f"⏱️ TIMING DEBUG: Total processing time: {processing_time:.2f} seconds")
+            logger.info(f"📊 COMPRESSION DEBUG: Compression ratio: {processing_stats['compression_ratio']:.2f}x")
+            
+            state.final_summary = final_summary
+            return state
+            
+        except Exception as e:
+            logger.error(f"❌ FINAL SUMMARY DEBUG: Error in final summary creation - {str(e)}")
+            state.error = f"Error creating final summary: {str(e)}"
+            return state
     
-    async def _process_chunks_async(self, prompts: List[str]) -> List[str]:
-        """Process multiple chunk prompts asynchronously."""
-        logger.info(f"🔄 ASYNC DEBUG: Processing {len(prompts)} chunks asynchronously")
+    def _count_tokens(self, text: str) -> int:
+        """
+        Estimate the model token count of a text.
+
+        Reuses the chunker's tiktoken encoder so the tokenizer is loaded once
+        per process; character counts under- or over-estimate real context
+        usage, which is what actually bounds chunk and prompt sizing.
+        """
+        return len(self.chunker.tokenizer.encode(text))
+
+    def _active_model_name(self) -> str:
+        """Return the model name for the currently configured LLM provider."""
+        if self.config.llm_provider == "ollama":
+            return self.config.ollama_model_name
+        return self.config.gemini_model_name
+
+    def _chunk_cache_key(self, chunk_text: str) -> str:
+        """Build a cache key covering model, temperature, and chunk content.
+
+        The chunk text is hashed rather than the full prompt: the prompt
+        embeds the segment's position ("segment N of M"), so keying on it
+        would invalidate every entry whenever the chunk count changes —
+        e.g. when a transcript grows by one chunk. The key doubles as the
+        Redis key, so it carries a "sum:" namespace prefix and keeps model
+        and temperature readable for debugging.
+        """
+        digest = hashlib.blake2b(chunk_text.encode("utf-8"), digest_size=16).hexdigest()
+        return f"sum:{self._active_model_name()}:{self.config.temperature}:{digest}"
+
+    def _chunk_cache_store(self, key: str, summary: str):
+        """Store a chunk summary, evicting the oldest entry when full."""
+        self._chunk_cache[key] = summary
+        self._chunk_cache.move_to_end(key)
+        while len(self._chunk_cache) > CHUNK_CACHE_MAX_ENTRIES:
+            self._chunk_cache.popitem(last=False)
+
+    async def _redis_get_many(self, keys: List[str]) -> List[Optional[str]]:
+        """Fetch cached summaries from Redis; any failure degrades to misses."""
+        if self._redis is None:
+            return [None] * len(keys)
+        try:
+            return await self._redis.mget(keys)
+        except Exception as e:
+            logger.warning(f"🗄️ CACHE DEBUG: Redis lookup failed, treating as misses - {e}")
+            return [None] * len(keys)
+
+    async def _redis_set_many(self, entries: List[tuple]):
+        """Store (key, summary) pairs in Redis with the configured TTL, best-effort."""
+        if self._redis is None or not entries:
+            return
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            for key, summary in entries:
+                pipe.set(key, summary, ex=self.config.chunk_cache_ttl)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"🗄️ CACHE DEBUG: Redis store failed, summaries kept in-process only - {e}")
+
+    async def _process_chunks_async(self, chunks: List[TextChunk]) -> List[str]:
+        """Summarize multiple chunks asynchronously, consulting the caches."""
+        logger.info(f"🔄 ASYNC DEBUG: Processing {len(chunks)} chunks asynchronously")
         logger.info(f"🌡️ ASYNC TEMPERATURE DEBUG: Using temperature={self.config.temperature}")
-        
-        async with self.llm_service:
-            responses = await self.llm_service.generate_multiple_async(
-                prompts, 
-                temperature=self.config.temperature
-            )
-            
-            results = [response.content.strip() for response in responses]
-            logger.info(f"✅ ASYNC DEBUG: Completed processing {len(results)} chunks")
-            return results
+
+        prompts = [
+            self._create_chunk_summary_prompt(chunk.content, i + 1, len(chunks))
+            for i, chunk in enumerate(chunks)
+        ]
+
+        # Partition chunks into cache hits and misses so re-runs or
+        # append-only transcript updates only pay for the new chunks.
+        # Keys derive from chunk content, not the prompts, which embed
+        # the position-dependent "segment N of M" line.
+        keys = [self._chunk_cache_key(chunk.content) for chunk in chunks]
+        results: List[Optional[str]] = [None] * len(chunks)
+        to_run: List[int] = []
+        for i, key in enumerate(keys):
+            cached = self._chunk_cache.get(key)
+            if cached is not None:
+                self._chunk_cache.move_to_end(key)
+                results[i] = cached
+            else:
+                to_run.append(i)
+
+        # L1 misses may still be hits in the shared Redis cache populated
+        # by other worker processes.
+        if to_run and self._redis is not None:
+            redis_values = await self._redis_get_many([keys[i] for i in to_run])
+            still_missing: List[int] = []
+            for i, value in zip(to_run, redis_values):
+                if value is not None:
+                    results[i] = value
+                    self._chunk_cache_store(keys[i], value)
+                else:
+                    still_missing.append(i)
+            to_run = still_missing
+
+        if len(to_run) < len(prompts):
+            logger.info(f"♻️ CACHE DEBUG: {len(prompts) - len(to_run)} of {len(prompts)} chunk summaries served from cache")
+
+        if to_run:
+            pending_prompts = [prompts[i] for i in to_run]
+            # The LLM service keeps a persistent session, so no per-call
+            # context-manager setup/teardown is needed here.
+            if self.config.batch_prompts and hasattr(self.llm_service, "generate_batched"):
+                # Opt-in (BATCH_PROMPTS): fold batch_size prompts into one
+                # structured request per HTTP call; groups whose output does
+                # not parse fall back to per-prompt generation internally.
+                responses = await self.llm_service.generate_batched(
+                    pending_prompts,
+                    temperature=self.config.temperature,
+                    batch_size=self.config.batch_size
+                )
+            elif hasattr(self.llm_service, "generate_batch"):
+                # Ollama: issue requests in server-sized groups so each group
+                # fills one real batch window instead of queueing server-side.
+                responses = await self.llm_service.generate_batch(
+                    pending_prompts,
+                    temperature=self.config.temperature
+                )
+            else:
+                responses = await self.llm_service.generate_multiple_async(
+                    pending_prompts,
+                    temperature=self.config.temperature
+                )
+
+            new_entries = []
+            for i, response in zip(to_run, responses):
+                summary = response.content.strip()
+                results[i] = summary
+                # Failed generations come back as flagged placeholder
+                # responses; caching those would pin the failure for the
+                # cache TTL even though a retry would likely succeed.
+                if getattr(response, "error", None):
+                    logger.warning(f"🗄️ CACHE DEBUG: Skipping cache store for failed chunk {i + 1}")
+                    continue
+                self._chunk_cache_store(keys[i], summary)
+                new_entries.append((keys[i], summary))
+            await self._redis_set_many(new_entries)
+
+        logger.info(f"✅ ASYNC DEBUG: Completed processing {len(results)} chunks")
+        return results
     
-    def _create_chunk_summary_prompt(self, chunk_text: str, chunk_num: int, total_chunks: int) -> str:
-        """Create a prompt for summarizing a text chunk."""
-        return f"""You are an expert at summarizing transcript content. Please provide a concise but comprehensive summary of the following transcript segment.
+    async def _collapse_summary_levels(self, summaries: List[str]) -> List[str]:
+        """
+        Tree-reduce chunk summaries until at most merge_fanout remain.
+
+        Long transcripts can produce more chunk summaries than fit one merge
+        prompt within the model's context window. Summaries are merged in
+        fanout-sized groups, with the merges at each level running
+        concurrently, until a single final merge call can integrate the rest.
+
+        Args:
+            summaries: Chunk summaries to reduce
+
+        Returns:
+            At most merge_fanout summaries, ready for the final merge call
+        """
+        fanout = max(2, self.config.merge_fanout)
+        level = 0
 
-This is chunk {chunk_num} of {total_chunks} from a larger transcript.
+        while len(summaries) > fanout:
+            level += 1
+            groups = [summaries[i:i + fanout] for i in range(0, len(summaries), fanout)]
+            logger.info(f"🌳 TREE REDUCE DEBUG: Level {level} - merging {len(summaries)} summaries in {len(groups)} groups of up to {fanout}")
+
+            prompts = [self._create_final_summary_prompt(_combine_summaries(group)) for group in groups]
+            if hasattr(self.llm_service, "generate_batch"):
+                responses = await self.llm_service.generate_batch(prompts, temperature=self.config.temperature)
+            else:
+                responses = await self.llm_service.generate_multiple_async(prompts, temperature=self.config.temperature)
+            summaries = [response.content.strip() for response in responses]
+
+        return summaries
+
+    def _write_summary_file(self, final_summary: str, original_file_name_base: str):
+        """Write the final summary to a timestamped markdown file in output/."""
+        output_dir = "output"
+        os.makedirs(output_dir, exist_ok=True)
+
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        output_file = os.path.join(output_dir, f"{original_file_name_base}_summary_{timestamp}.md")
+        with open(output_file, "w", encoding="utf-8") as f:
+            f.write(final_summary)
+
+    # Static chunk-prompt preamble, rendered once. Keeping this prefix
+    # byte-identical across all chunks lets Ollama's prompt/KV cache reuse the
+    # prefill for the instruction text; per-chunk details (position, content)
+    # only appear after it.
+    _CHUNK_PROMPT_PREFIX = """You are an expert at summarizing transcript content. Please provide a concise but comprehensive summary of the following transcript segment.
 
 Key requirements:
 - Capture the main topics and key points discussed
@@ -351,9 +609,38 @@ Key requirements:
 - Use clear, professional language
 
 Transcript segment:
-{chunk_text}
+"""
+
+    def _create_chunk_summary_prompt(self, chunk_text: str, chunk_num: int, total_chunks: int) -> str:
+        """Create a prompt for summarizing a text chunk."""
+        return (
+            self._CHUNK_PROMPT_PREFIX
+            + chunk_text
+            + f"\n\n(This is segment {chunk_num} of {total_chunks} from a larger transcript.)\n\nSummary:"
+        )
+
+    def _create_fused_prompt(self, chunks: List[str]) -> str:
+        """
+        Create a single prompt that maps and reduces in one LLM call.
+
+        All chunks are presented as numbered sections with one instruction to
+        summarize each and then combine them, replacing N chunk calls plus a
+        merge call with a single forward pass for medium-length inputs.
+        """
+        buf = io.StringIO()
+        buf.write("""You are an expert at summarizing transcript content. Below is a transcript split into numbered sections. First consider each section, then produce one combined summary of the whole transcript.
 
-Summary:"""
+Key requirements:
+- Capture the main topics and key points discussed
+- Preserve important details, names, and specific information
+- Keep the summary focused and well-structured
+- Maintain the chronological flow of information
+- Use clear, professional language
+""")
+        for i, chunk in enumerate(chunks):
+            buf.write(f"\nSection {i + 1} of {len(chunks)}:\n{chunk}\n")
+        buf.write("\nNow produce one combined summary of the full transcript:")
+        return buf.getvalue()
 
     def _create_final_summary_prompt(self, combined_summaries: str) -> str:
         """Create a prompt for the final summary."""
@@ -387,9 +674,14 @@ Please provide a comprehensive, exam-ready study guide:"""
         """
         try:
             logger.info(f"📂 VTT FILE DEBUG: Processing file {file_path}")
-            # Parse VTT file
-            segments = self.vtt_parser.parse_file(file_path)
-            full_text = self.vtt_parser.get_full_transcript()
+            # Parse VTT file off the event loop so in-flight LLM requests
+            # from other users keep making progress during the parse
+            segments = await asyncio.to_thread(self.vtt_parser.parse_file, file_path)
+            # Build the transcript from the returned segments rather than the
+            # parser's instance state: a concurrent upload can re-parse the
+            # shared parser between the await and the read, swapping in
+            # another request's segments.
+            full_text = " ".join(segment.text for segment in segments)
             logger.info(f"📄 VTT FILE DEBUG: Extracted {len(segments)} segments, {len(full_text)} chars total")
             
             return await self.summarize_text(full_text, original_file_name_base, chunk_size, chunk_overlap, temperature)
@@ -421,9 +713,10 @@ Please provide a comprehensive, exam-ready study guide:"""
         """
         try:
             logger.info(f"📄 VTT CONTENT DEBUG: Processing VTT content, {len(vtt_content)} chars")
-            # Parse VTT content
-            segments = self.vtt_parser.parse_content(vtt_content)
-            full_text = self.vtt_parser.get_full_transcript()
+            # Parse VTT content off the event loop
+            segments = await asyncio.to_thread(self.vtt_parser.parse_content, vtt_content)
+            # Join the returned segments directly; see summarize_vtt_file.
+            full_text = " ".join(segment.text for segment in segments)
             logger.info(f"📄 VTT CONTENT DEBUG: Extracted {len(segments)} segments, {len(full_text)} chars total")
             
             return await self.summarize_text(full_text, original_file_name_base, chunk_size, chunk_overlap, temperature)
@@ -466,26 +759,43 @@ Please provide a comprehensive, exam-ready study guide:"""
         
         logger.info(f"📊 SUMMARIZE DEBUG: Final config - Temperature: {self.config.temperature}, Chunk Size: {self.config.chunk_size}, Overlap: {self.config.chunk_overlap}")
         
-        # Create initial state
-        initial_state: SummarizationState = {
-            "original_text": text,
-            "chunks": None,
-            "chunk_summaries": None,
-            "final_summary": "",
-            "processing_stats": None,
-            "error": None,
-            "debug_config": None,
-            "original_file_name_base": original_file_name_base
-        }
+        # Drop leftover timing/cue noise before chunking; it costs tokens
+        # in every chunk prompt without contributing to the summary.
+        text = _strip_vtt_noise(text)
+
+        # Inputs this small cannot be meaningfully compressed — the "summary"
+        # would be as long as the original — so skip the LLM call entirely.
+        if 0 < len(text.strip()) <= self.config.min_summarize_chars:
+            logger.info(f"⏭️ SUMMARIZE DEBUG: Input below {self.config.min_summarize_chars} chars, returning text as-is")
+            stripped = text.strip()
+            return SummarizationResult(
+                summary=stripped,
+                original_length=len(stripped),
+                summary_length=len(stripped),
+                chunks_processed=0,
+                processing_time=0.0,
+                compression_ratio=1.0
+            )
+
+        # Create initial state; stages mutate it in place instead of
+        # cloning the full state dict on every transition
+        initial_state = SummarizationState(
+            original_text=text,
+            original_file_name_base=original_file_name_base
+        )
         
-        # Run the workflow
-        logger.info("🎬 SUMMARIZE DEBUG: Starting LangGraph workflow")
-        result_state = await self.workflow.ainvoke(initial_state)
-        logger.info("🏁 SUMMARIZE DEBUG: LangGraph workflow completed")
+        # Run the pipeline as plain sequential calls; each stage passes the
+        # state through untouched once an error has been recorded.
+        logger.info("🎬 SUMMARIZE DEBUG: Starting summarization pipeline")
+        state = await self._parse_input(initial_state)
+        state = await self._chunk_text(state)
+        state = await self._summarize_chunks(state)
+        result_state = await self._create_final_summary(state)
+        logger.info("🏁 SUMMARIZE DEBUG: Summarization pipeline completed")
         
         # Create result object
-        if result_state.get("error"):
-            logger.error(f"❌ SUMMARIZE DEBUG: Error in workflow - {result_state['error']}")
+        if result_state.error:
+            logger.error(f"❌ SUMMARIZE DEBUG: Error in pipeline - {result_state.error}")
             return SummarizationResult(
                 summary="",
                 original_length=len(text),
@@ -493,12 +803,12 @@ Please provide a comprehensive, exam-ready study guide:"""
                 chunks_processed=0,
                 processing_time=0.0,
                 compression_ratio=0.0,
-                error=result_state["error"]
+                error=result_state.error
             )
         
-        stats = result_state.get("processing_stats", {})
+        stats = result_state.processing_stats
         result = SummarizationResult(
-            summary=result_state.get("final_summary", ""),
+            summary=result_state.final_summary,
             original_length=stats.get("original_length", 0),
             summary_length=stats.get("final_summary_length", 0),
             chunks_processed=stats.get("chunks_summarized", 0),
@@ -511,10 +821,167 @@ Please provide a comprehensive, exam-ready study guide:"""
         
         return result
     
-    def check_service_health(self) -> Dict[str, Any]:
+    async def summarize_vtt_file_stream(self, file_path: str, original_file_name_base: str = "uploaded_transcript", chunk_size: Optional[int] = None, chunk_overlap: Optional[int] = None, temperature: Optional[float] = None) -> AsyncIterator[Union[str, SummarizationResult]]:
+        """
+        Summarize a VTT file, streaming the final summary as it is generated.
+
+        Args:
+            file_path: Path to the VTT file
+            chunk_size: Override chunk size (optional)
+            chunk_overlap: Override chunk overlap (optional)
+            temperature: Override temperature (optional)
+
+        Yields:
+            Growing partial summary strings, then a final SummarizationResult
+        """
+        try:
+            logger.info(f"📂 VTT STREAM DEBUG: Processing file {file_path}")
+            segments = await asyncio.to_thread(self.vtt_parser.parse_file, file_path)
+            # Join the returned segments directly; see summarize_vtt_file.
+            full_text = " ".join(segment.text for segment in segments)
+            logger.info(f"📄 VTT STREAM DEBUG: Extracted {len(segments)} segments, {len(full_text)} chars total")
+        except Exception as e:
+            logger.error(f"❌ VTT STREAM DEBUG: Error processing VTT file - {str(e)}")
+            yield SummarizationResult(
+                summary="",
+                original_length=0,
+                summary_length=0,
+                chunks_processed=0,
+                processing_time=0.0,
+                compression_ratio=0.0,
+                error=str(e)
+            )
+            return
+
+        async for item in self.summarize_text_stream(full_text, original_file_name_base, chunk_size, chunk_overlap, temperature):
+            yield item
+
+    async def summarize_text_stream(self, text: str, original_file_name_base: str = "uploaded_transcript", chunk_size: Optional[int] = None, chunk_overlap: Optional[int] = None, temperature: Optional[float] = None) -> AsyncIterator[Union[str, SummarizationResult]]:
+        """
+        Summarize plain text, streaming the final summary as it is generated.
+
+        Chunk summaries are still produced concurrently, but the last LLM call
+        streams token-by-token so the UI can render the summary as it grows.
+
+        Args:
+            text: Input text to summarize
+            chunk_size: Override chunk size (optional)
+            chunk_overlap: Override chunk overlap (optional)
+            temperature: Override temperature (optional)
+
+        Yields:
+            Growing partial summary strings, then a final SummarizationResult
+        """
+        logger.info("🚀 STREAM DEBUG: Starting streaming text summarization")
+
+        # Update configuration if provided
+        if chunk_size is not None or chunk_overlap is not None or temperature is not None:
+            new_chunk_size = chunk_size if chunk_size is not None else self.config.chunk_size
+            new_chunk_overlap = chunk_overlap if chunk_overlap is not None else self.config.chunk_overlap
+            new_temperature = temperature if temperature is not None else self.config.temperature
+            self.update_config(new_chunk_size, new_chunk_overlap, new_temperature)
+
+        start_time = time.time()
+
+        try:
+            if not text.strip():
+                raise ValueError("Empty input text")
+
+            text = _strip_vtt_noise(text)
+
+            # Small inputs are returned as-is, mirroring summarize_text
+            if len(text.strip()) <= self.config.min_summarize_chars:
+                logger.info(f"⏭️ STREAM DEBUG: Input below {self.config.min_summarize_chars} chars, returning text as-is")
+                stripped = text.strip()
+                yield stripped
+                yield SummarizationResult(
+                    summary=stripped,
+                    original_length=len(stripped),
+                    summary_length=len(stripped),
+                    chunks_processed=0,
+                    processing_time=time.time() - start_time,
+                    compression_ratio=1.0
+                )
+                return
+
+            # Tokenizer-heavy chunking runs in a worker thread; chunks are
+            # materialized from the incremental chunker as they complete.
+            chunks = await asyncio.to_thread(self.chunker.chunk_recursive, text)
+            logger.info(f"📊 STREAM DEBUG: Created {len(chunks)} chunks")
+
+            if len(chunks) == 1:
+                # One LLM call total: stream the chunk summary directly.
+                # Only the single-chunk case may take this shortcut — with a
+                # raised min_chunks_for_final_merge it would drop every chunk
+                # but the first; multi-chunk inputs below the merge threshold
+                # go through the fused prompt so all content reaches the model.
+                final_prompt = self._create_chunk_summary_prompt(chunks[0].content, 1, 1)
+                chunks_processed = 1
+            elif len(chunks) <= self.config.fuse_threshold:
+                # Medium-length inputs: map and reduce in one streamed call
+                logger.info(f"🔗 STREAM DEBUG: Streaming fused map-reduce call for {len(chunks)} chunks")
+                final_prompt = self._create_fused_prompt([chunk.content for chunk in chunks])
+                chunks_processed = len(chunks)
+            else:
+                chunk_summaries = await self._process_chunks_async(chunks)
+                chunks_processed = len(chunk_summaries)
+                # Tree-reduce so the streamed final merge fits the context window
+                chunk_summaries = await self._collapse_summary_levels(chunk_summaries)
+                combined_summaries = _combine_summaries(chunk_summaries)
+                final_prompt = self._create_final_summary_prompt(combined_summaries)
+
+            logger.info("📡 STREAM DEBUG: Streaming final summary from LLM service")
+            parts: List[str] = []
+            async for piece in self.llm_service.generate_stream(final_prompt, temperature=self.config.temperature):
+                parts.append(piece)
+                yield "".join(parts)
+
+            final_summary = "".join(parts).strip()
+            self._write_summary_file(final_summary, original_file_name_base)
+
+            processing_time = time.time() - start_time
+            logger.info(f"⏱️ STREAM DEBUG: Total processing time: {processing_time:.2f} seconds")
+
+            # The compression ratio needs a full-transcript token count;
+            # run both encodes off the loop so the closing stats don't
+            # stall other in-flight streams.
+            original_tokens = await asyncio.to_thread(self._count_tokens, text)
+            final_summary_tokens = await asyncio.to_thread(self._count_tokens, final_summary)
+            yield SummarizationResult(
+                summary=final_summary,
+                original_length=len(text),
+                summary_length=len(final_summary),
+                chunks_processed=chunks_processed,
+                processing_time=processing_time,
+                compression_ratio=original_tokens / final_summary_tokens if final_summary_tokens else 0.0
+            )
+
+        except Exception as e:
+            logger.error(f"❌ STREAM DEBUG: Error in streaming summarization - {str(e)}")
+            yield SummarizationResult(
+                summary="",
+                original_length=len(text),
+                summary_length=0,
+                chunks_processed=0,
+                processing_time=time.time() - start_time,
+                compression_ratio=0.0,
+                error=str(e)
+            )
+
+    async def aclose(self):
+        """Release the LLM service's persistent session on application shutdown."""
+        await self.llm_service.aclose()
+        if self._redis is not None:
+            await self._redis.aclose()
+
+    async def check_service_health(self) -> Dict[str, Any]:
         """
         Check the health of the current LLM service and model availability.
-        
+
+        The three probes (connection, model availability, model info) fire
+        concurrently, so the wall time is the slowest round-trip instead of
+        the sum of all three.
+
         Returns:
             Health check results
         """
@@ -525,19 +992,29 @@ Please provide a comprehensive, exam-ready study guide:"""
             "model_info": {},
             "timestamp": time.time()
         }
-        
+
         try:
-            # Test connection
-            health_status["connection_ok"] = self.llm_service.test_connection()
-            
-            if health_status["connection_ok"]:
-                # Check model availability
-                health_status["model_available"] = self.llm_service.check_model_availability()
-                
-                # Get model info
-                health_status["model_info"] = self.llm_service.get_model_info()
-        
+            if hasattr(self.llm_service, "test_connection_async"):
+                probes = [
+                    self.llm_service.test_connection_async(),
+                    self.llm_service.check_model_availability_async(),
+                    self.llm_service.get_model_info_async()
+                ]
+            else:
+                # Blocking probes (Gemini) run in worker threads
+                probes = [
+                    asyncio.to_thread(self.llm_service.test_connection),
+                    asyncio.to_thread(self.llm_service.check_model_availability),
+                    asyncio.to_thread(self.llm_service.get_model_info)
+                ]
+
+            connection_ok, model_available, model_info = await asyncio.gather(*probes, return_exceptions=True)
+
+            health_status["connection_ok"] = connection_ok is True
+            health_status["model_available"] = model_available is True
+            health_status["model_info"] = model_info if isinstance(model_info, dict) else {"error": str(model_info)}
+
         except Exception as e:
             health_status["error"] = str(e)
-        
+
         return health_status
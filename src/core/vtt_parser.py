@@ -1,3 +1,6 @@
+import os
+import tempfile
+
 import webvtt
 from typing import List, Optional
 from dataclasses import dataclass
@@ -63,9 +66,6 @@ class VTTParser:
             
         try:
             # Write content to a temporary file and parse it
-            import tempfile
-            import os
-            
             with tempfile.NamedTemporaryFile(mode='w', suffix='.vtt', delete=False) as tmp_file:
                 tmp_file.write(vtt_content)
                 tmp_file_path = tmp_file.name
@@ -24,7 +24,7 @@ class GeminiResponse:
 class GeminiService:
     """Service for interacting with Google Gemini API."""
     
-    def __init__(self, api_key: str, model: str = "gemini-pro", timeout: int = 300):
+    def __init__(self, api_key: str, model: str = "gemini-pro", timeout: int = 300, max_concurrent: int = 3):
         """
         Initialize Gemini service.
         
@@ -32,26 +32,52 @@ class GeminiService:
             api_key: Google Gemini API key
             model: Model name to use (e.g., "gemini-pro")
             timeout: Request timeout in seconds
+            max_concurrent: Maximum concurrent generation requests
         """
         self.api_key = api_key
         self.model_name = model
         self.timeout = timeout
+        self.max_concurrent = max(1, max_concurrent)
         genai.configure(api_key=self.api_key)
         self.model = genai.GenerativeModel(self.model_name)
         self.session = None # aiohttp session for async operations if needed for direct http calls
+        # Created lazily alongside the session so it binds to the running loop
+        self._sem: Optional[asyncio.Semaphore] = None
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """
+        Lazily create the shared aiohttp session on first use.
+
+        google-generativeai handles its own async HTTP, so this session only
+        backs any direct HTTP calls; it persists for the service lifetime.
+
+        Returns:
+            The shared aiohttp.ClientSession
+        """
+        if self.session is None or self.session.closed:
+            logger.info("Creating persistent aiohttp session for Gemini service.")
+            self.session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=5, sock_read=self.timeout)
+            )
+            # Cap concurrent generations so a long transcript cannot fan out
+            # hundreds of simultaneous API calls and trip rate limits.
+            self._sem = asyncio.Semaphore(self.max_concurrent)
+        return self.session
+
+    async def aclose(self):
+        """Close the shared aiohttp session (call on application shutdown)."""
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
 
     async def __aenter__(self):
         """Async context manager entry."""
-        # For google-generativeai, aiohttp.ClientSession might not be directly used
-        # as the library handles its own async HTTP.
-        # However, if we were to make direct HTTP calls, we'd initialize it here.
-        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+        await self._ensure_session()
         return self
-    
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        if self.session:
-            await self.session.close()
+        """Async context manager exit. The shared session is kept open for reuse."""
+        return None
     
     def test_connection(self) -> bool:
         """
@@ -197,61 +223,75 @@ class GeminiService:
             logger.error(f"Error communicating with Gemini during asynchronous generation: {str(e)}")
             raise Exception(f"Error communicating with Gemini: {str(e)}")
 
-    async def generate_multiple_async(self, prompts: List[str], temperature: float = 0.3, system_prompt: Optional[str] = None) -> List[GeminiResponse]:
+    async def generate_stream(self, prompt: str, temperature: float = 0.3, system_prompt: Optional[str] = None):
         """
-        Generate text for multiple prompts concurrently.
+        Generate text as a stream of tokens using Gemini.
+
+        Yields response text pieces as they arrive so callers can surface
+        partial output instead of waiting for the full completion.
 
         Args:
-            prompts: List of input prompts
+            prompt: Input prompt
             temperature: Temperature for generation
             system_prompt: Optional system prompt
 
-        Returns:
-            List of GeminiResponse objects
+        Yields:
+            Response text fragments as they are generated
         """
-        logger.info(f"Sending {len(prompts)} concurrent asynchronous generation requests for Gemini model '{self.model_name}'")
-        
-        tasks = []
-        for prompt in prompts:
+        logger.info(f"Sending streaming generation request to Gemini for model '{self.model_name}'")
+        try:
+            generation_config = {
+                "temperature": temperature,
+                "max_output_tokens": 8000
+            }
+
             contents = []
             if system_prompt:
                 contents.append({"role": "user", "parts": [system_prompt]})
                 contents.append({"role": "model", "parts": ["Okay, I understand."]})
             contents.append({"role": "user", "parts": [prompt]})
-            
-            generation_config = {
-                "temperature": temperature,
-                "max_output_tokens": 5120
-            }
-            
-            tasks.append(self.model.generate_content_async(
+
+            response = await self.model.generate_content_async(
                 contents,
                 generation_config=generation_config,
-                request_options={"timeout": self.timeout}
-            ))
+                request_options={"timeout": self.timeout},
+                stream=True
+            )
+
+            async for chunk in response:
+                if chunk.candidates:
+                    for part in chunk.candidates[0].content.parts:
+                        if part.text:
+                            yield part.text
+
+            logger.info(f"Streaming generation completed for model '{self.model_name}'.")
+
+        except Exception as e:
+            logger.error(f"Error communicating with Gemini during streaming generation: {str(e)}")
+            raise Exception(f"Error communicating with Gemini: {str(e)}")
+
+    async def generate_multiple_async(self, prompts: List[str], temperature: float = 0.3, system_prompt: Optional[str] = None) -> List[GeminiResponse]:
+        """
+        Generate text for multiple prompts concurrently.
+
+        Args:
+            prompts: List of input prompts
+            temperature: Temperature for generation
+            system_prompt: Optional system prompt
+
+        Returns:
+            List of GeminiResponse objects
+        """
+        await self._ensure_session()
+
+        logger.info(f"Sending {len(prompts)} generation requests with at most {self.max_concurrent} in flight for Gemini model '{self.model_name}'")
+
+        async def _bounded(prompt: str) -> GeminiResponse:
+            async with self._sem:
+                return await self.generate_async(prompt, temperature, system_prompt)
 
         try:
-            responses: List[GenerateContentResponse] = await asyncio.gather(*tasks)
-            
-            results = []
-            for response in responses:
-                response_text = ""
-                if response.candidates:
-                    for part in response.candidates[0].content.parts:
-                        response_text += part.text
-                
-                prompt_tokens = response.usage_metadata.prompt_token_count if response.usage_metadata else None
-                completion_tokens = response.usage_metadata.candidates_token_count if response.usage_metadata else None
-                total_tokens = response.usage_metadata.total_token_count if response.usage_metadata else None
-                
-                results.append(GeminiResponse(
-                    content=response_text.strip(),
-                    model=self.model_name,
-                    prompt_tokens=prompt_tokens,
-                    completion_tokens=completion_tokens,
-                    total_tokens=total_tokens
-                ))
-            
+            results = await asyncio.gather(*[_bounded(prompt) for prompt in prompts])
             logger.info(f"Successfully completed {len(results)} concurrent asynchronous generations for Gemini.")
             return results
         except Exception as e:
@@ -1,16 +1,27 @@
 import requests
-import json
+import random
+
+# orjson parses multi-KB LLM responses several times faster than stdlib
+# json; fall back transparently when it is not installed.
+try:
+    import orjson
+except ImportError:
+    import json as orjson
 from typing import Dict, Any, Optional, List
 import asyncio
 import aiohttp
 from dataclasses import dataclass
 import time
 import logging
+from urllib3.util.retry import Retry
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# HTTP statuses worth retrying: rate limiting and transient server errors
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504, 529}
+
 @dataclass
 class OllamaResponse:
     """Response from Ollama API."""
@@ -20,34 +31,203 @@ class OllamaResponse:
     load_duration: Optional[int] = None
     prompt_eval_count: Optional[int] = None
     eval_count: Optional[int] = None
+    # Set on placeholder responses substituted for failed generations,
+    # so callers can tell real output from a "[chunk failed]" marker.
+    error: Optional[str] = None
 
 class OllamaService:
     """Service for interacting with Ollama API."""
     
-    def __init__(self, base_url: str = "http://localhost:11434", model: str = "llama3.1:8b", timeout: int = 500):
+    def __init__(self, base_url: str = "http://localhost:11434", model: str = "llama3.1:8b", timeout: int = 500, num_parallel: int = 4):
         """
         Initialize Ollama service.
-        
+
         Args:
             base_url: Base URL for Ollama API
             model: Model name to use
             timeout: Request timeout in seconds
+            num_parallel: Number of requests Ollama processes in parallel
+                (should match the server's OLLAMA_NUM_PARALLEL setting)
         """
         self.base_url = base_url.rstrip('/')
         self.model = model
         self.timeout = timeout
+        self.num_parallel = max(1, num_parallel)
         self.session = None
-    
+        # Created lazily alongside the session so it binds to the running loop
+        self._sem: Optional[asyncio.Semaphore] = None
+        # Short-lived cache of the parsed /api/tags model list
+        self._tags_cache: Optional[tuple] = None
+
+        # Persistent session for the synchronous helpers so sequential calls
+        # (health checks, warm-up, pulls) reuse pooled keep-alive connections
+        # instead of paying TCP setup per request.
+        self._sync_session = requests.Session()
+        self._sync_session.headers.update({"Content-Type": "application/json"})
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=self.num_parallel,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=1.0,
+                status_forcelist=sorted(_RETRYABLE_STATUS),
+                allowed_methods=frozenset({"GET", "POST"})
+            )
+        )
+        self._sync_session.mount("http://", adapter)
+        self._sync_session.mount("https://", adapter)
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """
+        Lazily create the shared aiohttp session on first use.
+
+        The session is kept alive for the lifetime of the service so that
+        repeated generation calls reuse pooled TCP connections instead of
+        paying a new handshake per request.
+
+        Returns:
+            The shared aiohttp.ClientSession
+        """
+        if self.session is None or self.session.closed:
+            logger.info("Creating persistent aiohttp session for Ollama service.")
+            # keepalive_timeout above Ollama's idle window keeps the pooled
+            # connections open between bursts instead of re-handshaking;
+            # the pool is sized to the server's real parallelism.
+            connector = aiohttp.TCPConnector(
+                limit=self.num_parallel,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True
+            )
+            # Split connect/read budgets: a dead server fails the TCP
+            # connect in ~5s instead of burning the whole generation budget,
+            # while long generations keep their full read timeout.
+            self.session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=5, sock_read=self.timeout),
+                connector=connector
+            )
+            # Cap in-flight generations at the server's real batch width:
+            # Ollama only interleaves OLLAMA_NUM_PARALLEL requests, so
+            # anything beyond that just queues server-side.
+            self._sem = asyncio.Semaphore(self.num_parallel)
+        return self.session
+
+    async def _call_with_retry(self, coro_factory, max_retries: int = 3, base: float = 1.0, cap: float = 30.0):
+        """
+        Run an async request, retrying transient failures with backoff.
+
+        A single dropped connection or 503 from an overloaded server would
+        otherwise kill an entire multi-chunk summary. Retries use capped
+        exponential backoff with jitter so concurrent chunks do not all
+        hammer the server again at the same instant.
+
+        Args:
+            coro_factory: Zero-argument callable returning a fresh coroutine
+            max_retries: Number of retries after the initial attempt
+            base: Initial backoff delay in seconds
+            cap: Maximum backoff delay in seconds
+
+        Returns:
+            The result of the first successful call
+        """
+        for attempt in range(max_retries + 1):
+            try:
+                return await coro_factory()
+            except aiohttp.ClientResponseError as e:
+                if e.status not in _RETRYABLE_STATUS or attempt == max_retries:
+                    raise
+                error = e
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt == max_retries:
+                    raise
+                error = e
+            delay = min(cap, base * 2 ** attempt) * (1 + random.random() * 0.5)
+            logger.warning(f"Transient Ollama error ({error}); retry {attempt + 1}/{max_retries} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    def close(self):
+        """Close the persistent requests session used by the sync helpers."""
+        self._sync_session.close()
+
+    async def aclose(self):
+        """Close the shared aiohttp session (call on application shutdown)."""
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+        self.close()
+
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+        await self._ensure_session()
         return self
-    
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        if self.session:
-            await self.session.close()
+        """Async context manager exit. The shared session is kept open for reuse."""
+        return None
     
+    def _get_tags(self, ttl: float = 5.0) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch the server's model list, caching the parsed result briefly.
+
+        Health checks hit /api/tags several times in quick succession
+        (startup probe, health button, pre-summarize check); the model set
+        does not change mid-session, so a short TTL removes the redundant
+        round-trips. Failures are never cached.
+
+        Args:
+            ttl: Cache lifetime in seconds
+
+        Returns:
+            Parsed model list, or None if the server could not be reached
+        """
+        if self._tags_cache is not None:
+            cached_at, models = self._tags_cache
+            if time.monotonic() - cached_at < ttl:
+                return models
+
+        url = f"{self.base_url}/api/tags"
+        logger.info(f"Fetching model list from {url}")
+        try:
+            response = self._sync_session.get(url, timeout=5)
+            if response.status_code != 200:
+                logger.warning(f"Failed to fetch Ollama model list. Status code: {response.status_code}")
+                return None
+            models = orjson.loads(response.content).get('models', [])
+            self._tags_cache = (time.monotonic(), models)
+            return models
+        except Exception as e:
+            logger.error(f"Error fetching Ollama model list: {e}")
+            return None
+
+    async def _get_tags_async(self, ttl: float = 5.0) -> Optional[List[Dict[str, Any]]]:
+        """
+        Async variant of `_get_tags`; shares the same TTL cache.
+
+        Args:
+            ttl: Cache lifetime in seconds
+
+        Returns:
+            Parsed model list, or None if the server could not be reached
+        """
+        if self._tags_cache is not None:
+            cached_at, models = self._tags_cache
+            if time.monotonic() - cached_at < ttl:
+                return models
+
+        url = f"{self.base_url}/api/tags"
+        logger.info(f"Fetching model list from {url}")
+        try:
+            session = await self._ensure_session()
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
+                if response.status != 200:
+                    logger.warning(f"Failed to fetch Ollama model list. Status code: {response.status}")
+                    return None
+                models = orjson.loads(await response.read()).get('models', [])
+                self._tags_cache = (time.monotonic(), models)
+                return models
+        except Exception as e:
+            logger.error(f"Error fetching Ollama model list: {e}")
+            return None
+
     def test_connection(self) -> bool:
         """
         Test connection to Ollama server.
@@ -55,19 +235,11 @@ class OllamaService:
         Returns:
             True if connection successful, False otherwise
         """
-        url = f"{self.base_url}/api/tags"
-        logger.info(f"Attempting to test connection to Ollama at {url}")
-        try:
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                logger.info("Successfully connected to Ollama.")
-                return True
-            else:
-                logger.warning(f"Failed to connect to Ollama. Status code: {response.status_code}")
-            return False
-        except Exception as e:
-            logger.error(f"Error testing connection to Ollama: {e}")
-            return False
+        logger.info(f"Testing connection to Ollama at {self.base_url}")
+        if self._get_tags() is not None:
+            logger.info("Successfully connected to Ollama.")
+            return True
+        return False
     
     def check_model_availability(self) -> bool:
         """
@@ -75,25 +247,72 @@ class OllamaService:
         Returns:
             True if model is available, False otherwise
         """
-        url = f"{self.base_url}/api/tags"
-        logger.info(f"Checking availability of model '{self.model}' at {url}")
-        try:
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                models = response.json().get('models', [])
-                if any(model['name'].startswith(self.model) for model in models):
-                    logger.info(f"Model '{self.model}' is available.")
-                    return True
-                else:
-                    logger.warning(f"Model '{self.model}' not found in Ollama models.")
+        logger.info(f"Checking availability of model '{self.model}'")
+        models = self._get_tags()
+        if models is None:
             return False
-        except Exception as e:
-            logger.error(f"Error checking model availability: {e}")
+        if any(model['name'].startswith(self.model) for model in models):
+            logger.info(f"Model '{self.model}' is available.")
+            return True
+        logger.warning(f"Model '{self.model}' not found in Ollama models.")
+        return False
+
+    async def test_connection_async(self) -> bool:
+        """
+        Test connection to Ollama server without blocking the event loop.
+
+        Returns:
+            True if connection successful, False otherwise
+        """
+        logger.info(f"Testing connection to Ollama at {self.base_url}")
+        if await self._get_tags_async() is not None:
+            logger.info("Successfully connected to Ollama.")
+            return True
+        return False
+
+    async def check_model_availability_async(self) -> bool:
+        """
+        Check if the specified model is available without blocking the event loop.
+
+        Returns:
+            True if model is available, False otherwise
+        """
+        logger.info(f"Checking availability of model '{self.model}'")
+        models = await self._get_tags_async()
+        if models is None:
             return False
+        if any(model['name'].startswith(self.model) for model in models):
+            logger.info(f"Model '{self.model}' is available.")
+            return True
+        logger.warning(f"Model '{self.model}' not found in Ollama models.")
+        return False
 
-    def generate_sync(self, prompt: str, temperature: float = 0.3, system_prompt: Optional[str] = None) -> OllamaResponse:
+    async def get_model_info_async(self) -> Dict[str, Any]:
         """
-        Generate text synchronously using Ollama.
+        Get information about the current model without blocking the event loop.
+
+        Returns:
+            Model information dictionary
+        """
+        url = f"{self.base_url}/api/show"
+        logger.info(f"Requesting model info for '{self.model}' from {url}")
+        try:
+            session = await self._ensure_session()
+            async with session.post(url, json={"name": self.model}, timeout=aiohttp.ClientTimeout(total=5)) as response:
+                response.raise_for_status()
+                logger.info(f"Successfully retrieved model info for '{self.model}'.")
+                return orjson.loads(await response.read())
+        except Exception as e:
+            logger.error(f"Could not get model info for '{self.model}': {e}")
+            return {"error": f"Could not get model info: {str(e)}"}
+
+    def _build_body(self, prompt: str, temperature: float, system_prompt: Optional[str]) -> bytes:
+        """
+        Serialize a generate-request body with orjson.
+
+        Passing pre-serialized bytes as `data=` skips the HTTP library's
+        per-call JSON encoder — a small win that repeats once per chunk on
+        long transcripts.
 
         Args:
             prompt: Input prompt
@@ -101,53 +320,76 @@ class OllamaService:
             system_prompt: Optional system prompt
 
         Returns:
-            OllamaResponse object
+            The request body ready to send as raw data
         """
-        url = f"{self.base_url}/api/generate"
-
         payload = {
             "model": self.model,
             "prompt": prompt,
-            "stream": False,
+            "stream": True,
             "options": {
                 "temperature": temperature,
                 "num_predict": -1  # Generate until natural stopping point
             }
         }
-
         if system_prompt:
             payload["system"] = system_prompt
+        return orjson.dumps(payload)
+
+    def generate_sync(self, prompt: str, temperature: float = 0.3, system_prompt: Optional[str] = None) -> OllamaResponse:
+        """
+        Generate text synchronously using Ollama.
+
+        Args:
+            prompt: Input prompt
+            temperature: Temperature for generation
+            system_prompt: Optional system prompt
+
+        Returns:
+            OllamaResponse object
+        """
+        url = f"{self.base_url}/api/generate"
+        body = self._build_body(prompt, temperature, system_prompt)
 
         logger.info(f"Sending synchronous generation request to {url} for model '{self.model}'")
         try:
-            response = requests.post(
+            # Consume the NDJSON stream incrementally instead of letting the
+            # server buffer the whole completion and decoding one huge JSON
+            # document at the end.
+            response = self._sync_session.post(
                 url,
-                json=payload,
-                timeout=self.timeout,
-                headers={"Content-Type": "application/json"}
+                data=body,
+                timeout=(5, self.timeout),  # (connect, read)
+                stream=True
             )
             response.raise_for_status()
 
-            result = response.json()
+            parts: List[str] = []
+            final_frame: Dict[str, Any] = {}
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                data = orjson.loads(line)
+                piece = data.get("response", "")
+                if piece:
+                    parts.append(piece)
+                if data.get("done"):
+                    # Timing/token stats only appear on the final frame
+                    final_frame = data
+                    break
+
             logger.info(f"Synchronous generation successful for model '{self.model}'.")
             return OllamaResponse(
-                content=result.get("response", ""),
-                model=result.get("model", self.model),
-                total_duration=result.get("total_duration"),
-                load_duration=result.get("load_duration"),
-                prompt_eval_count=result.get("prompt_eval_count"),
-                eval_count=result.get("eval_count")
+                content="".join(parts),
+                model=final_frame.get("model", self.model),
+                total_duration=final_frame.get("total_duration"),
+                load_duration=final_frame.get("load_duration"),
+                prompt_eval_count=final_frame.get("prompt_eval_count"),
+                eval_count=final_frame.get("eval_count")
             )
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Error communicating with Ollama during synchronous generation: {str(e)}")
             raise Exception(f"Error communicating with Ollama: {str(e)}")
-        except json.JSONDecodeError as e:
-            logger.error(f"Error parsing Ollama response during synchronous generation: {str(e)}")
-            raise Exception(f"Error parsing Ollama response: {str(e)}")
-        except Exception as e:
-            logger.error(f"An unexpected error occurred during synchronous generation: {str(e)}")
-            raise Exception(f"Error communicating with Ollama: {str(e)}")
 
     async def generate_async(self, prompt: str, temperature: float = 0.3, system_prompt: Optional[str] = None) -> OllamaResponse:
         """
@@ -161,66 +403,110 @@ class OllamaService:
         Returns:
             OllamaResponse object
         """
-        if not self.session:
-            logger.error("Aiohttp session not initialized for asynchronous generation.")
-            raise Exception("Session not initialized. Use async context manager.")
+        session = await self._ensure_session()
 
         url = f"{self.base_url}/api/generate"
+        body = self._build_body(prompt, temperature, system_prompt)
 
-        payload = {
-            "model": self.model,
-            "prompt": prompt,
-            "stream": False,
-            "options": {
-                "temperature": temperature,
-                "num_predict": -1
-            }
-        }
-
-        if system_prompt:
-            payload["system"] = system_prompt
+        async def _do_generate() -> OllamaResponse:
+            # Stream the NDJSON response so the event loop sees small decode
+            # units as tokens arrive instead of one large decode at the end.
+            async with self._sem:
+                async with session.post(url, data=body, headers={"Content-Type": "application/json"}) as response:
+                    response.raise_for_status()
+                    parts: List[str] = []
+                    final_frame: Dict[str, Any] = {}
+                    async for line in response.content:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        data = orjson.loads(line)
+                        piece = data.get("response", "")
+                        if piece:
+                            parts.append(piece)
+                        if data.get("done"):
+                            # Timing/token stats only appear on the final frame
+                            final_frame = data
+                            break
+                    return OllamaResponse(
+                        content="".join(parts),
+                        model=final_frame.get("model", self.model),
+                        total_duration=final_frame.get("total_duration"),
+                        load_duration=final_frame.get("load_duration"),
+                        prompt_eval_count=final_frame.get("prompt_eval_count"),
+                        eval_count=final_frame.get("eval_count")
+                    )
 
         logger.info(f"Sending asynchronous generation request to {url} for model '{self.model}'")
         try:
-            async with self.session.post(url, json=payload) as response:
-                response.raise_for_status()
-                result = await response.json()
-
-                logger.info(f"Asynchronous generation successful for model '{self.model}'.")
-                return OllamaResponse(
-                    content=result.get("response", ""),
-                    model=result.get("model", self.model),
-                    total_duration=result.get("total_duration"),
-                    load_duration=result.get("load_duration"),
-                    prompt_eval_count=result.get("prompt_eval_count"),
-                    eval_count=result.get("eval_count")
-                )
-
-        except aiohttp.ClientError as e:
+            result = await self._call_with_retry(_do_generate)
+            logger.info(f"Asynchronous generation successful for model '{self.model}'.")
+            return result
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"Aiohttp client error during asynchronous generation: {e}")
             raise Exception(f"Error communicating with Ollama: {str(e)}")
-        except json.JSONDecodeError as e:
-            logger.error(f"Error parsing Ollama response during asynchronous generation: {e}")
-            raise Exception(f"Error parsing Ollama response: {str(e)}")
-        except Exception as e:
-            logger.error(f"An unexpected error occurred during asynchronous generation: {e}")
-            raise Exception(f"Error : {str(e)}")
+
+    async def generate_stream(self, prompt: str, temperature: float = 0.3, system_prompt: Optional[str] = None):
+        """
+        Generate text as a stream of tokens using Ollama.
+
+        Yields response text pieces as they arrive from Ollama's NDJSON
+        streaming endpoint, so callers can surface partial output instead of
+        waiting for the full completion.
+
+        Args:
+            prompt: Input prompt
+            temperature: Temperature for generation
+            system_prompt: Optional system prompt
+
+        Yields:
+            Response text fragments as they are generated
+        """
+        session = await self._ensure_session()
+
+        url = f"{self.base_url}/api/generate"
+        body = self._build_body(prompt, temperature, system_prompt)
+
+        logger.info(f"Sending streaming generation request to {url} for model '{self.model}'")
+        try:
+            async with session.post(url, data=body, headers={"Content-Type": "application/json"}) as response:
+                response.raise_for_status()
+                async for line in response.content:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    data = orjson.loads(line)
+                    piece = data.get("response", "")
+                    if piece:
+                        yield piece
+                    if data.get("done"):
+                        break
+            logger.info(f"Streaming generation completed for model '{self.model}'.")
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Aiohttp client error during streaming generation: {e}")
+            raise Exception(f"Error communicating with Ollama: {str(e)}")
 
     async def generate_multiple_async(self, prompts: List[str], temperature: float = 0.3, system_prompt: Optional[str] = None) -> List[OllamaResponse]:
         """
         Generate text for multiple prompts concurrently.
 
+        Individual failures do not abort the batch: each prompt already
+        retries transient errors internally, and any that still fails is
+        replaced by a "[chunk failed]" placeholder response so the
+        remaining completions survive.
+
         Args:
             prompts: List of input prompts
             temperature: Temperature for generation
             system_prompt: Optional system prompt
 
         Returns:
-            List of OllamaResponse objects
+            List of OllamaResponse objects in prompt order; failed prompts
+            yield placeholder responses
         """
-        if not self.session:
-            logger.error("Aiohttp session not initialized for multiple asynchronous generations.")
-            raise Exception("Session not initialized. Use async context manager.")
+        await self._ensure_session()
 
         logger.info(f"Sending {len(prompts)} concurrent asynchronous generation requests for model '{self.model}'")
         tasks = [
@@ -228,13 +514,133 @@ class OllamaService:
             for prompt in prompts
         ]
 
-        try:
-            results = await asyncio.gather(*tasks)
+        # return_exceptions keeps every other in-flight completion when one
+        # chunk fails; gather's default would cancel minutes of GPU work.
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        failures = 0
+        for i, result in enumerate(results):
+            if isinstance(result, BaseException):
+                failures += 1
+                logger.error(f"Generation failed for prompt {i + 1}/{len(prompts)}: {result}")
+                results[i] = OllamaResponse(content="[chunk failed]", model=self.model, error=str(result))
+
+        if failures:
+            logger.warning(f"Completed {len(results)} generations with {failures} failed chunk(s) substituted.")
+        else:
             logger.info(f"Successfully completed {len(results)} concurrent asynchronous generations.")
-            return results
-        except Exception as e:
-            logger.error(f"An error occurred during concurrent asynchronous generation: {e}")
-            raise
+        return results
+
+    async def generate_batch(self, prompts: List[str], temperature: float = 0.3, system_prompt: Optional[str] = None) -> List[OllamaResponse]:
+        """
+        Generate text for multiple prompts with at most `num_parallel` in flight.
+
+        Stock Ollama only interleaves as many requests as OLLAMA_NUM_PARALLEL
+        allows; firing more than that just queues server-side with extra
+        context duplication. The semaphore in `generate_async` keeps exactly
+        `num_parallel` requests in flight and starts the next one as soon as
+        a slot frees up, so a slow prompt never stalls a whole group.
+
+        Args:
+            prompts: List of input prompts
+            temperature: Temperature for generation
+            system_prompt: Optional system prompt
+
+        Returns:
+            List of OllamaResponse objects in prompt order
+        """
+        await self._ensure_session()
+
+        logger.info(f"Dispatching {len(prompts)} prompts with at most {self.num_parallel} in flight for model '{self.model}'")
+        return await self.generate_multiple_async(prompts, temperature, system_prompt)
+
+    def _build_batched_prompt(self, prompts: List[str]) -> str:
+        """Build one structured prompt asking for a JSON array of answers."""
+        sections = "\n\n".join(
+            f"Task {i + 1}:\n{prompt}" for i, prompt in enumerate(prompts)
+        )
+        return (
+            "Complete each of the following numbered tasks separately. "
+            "Respond with only a JSON array of objects of the form "
+            '{"index": <task number>, "answer": "<answer text>"}, one per task, in task order.\n\n'
+            + sections
+        )
+
+    def _parse_batched_response(self, content: str, expected: int) -> Optional[List[str]]:
+        """
+        Extract the per-task answers from a batched JSON response.
+
+        Args:
+            content: Raw model output, hopefully containing a JSON array
+            expected: Number of answers the array must contain
+
+        Returns:
+            Answers in task order, or None if the output does not parse
+        """
+        start = content.find("[")
+        end = content.rfind("]")
+        if start == -1 or end <= start:
+            return None
+        try:
+            items = orjson.loads(content[start:end + 1])
+        except ValueError:
+            return None
+        if not isinstance(items, list) or len(items) != expected:
+            return None
+
+        answers: List[Optional[str]] = [None] * expected
+        for position, item in enumerate(items):
+            if isinstance(item, dict):
+                index = item.get("index", position + 1)
+                answer = item.get("answer") or item.get("summary")
+            else:
+                index, answer = position + 1, item
+            if not isinstance(answer, str) or not isinstance(index, int) or not 1 <= index <= expected:
+                return None
+            answers[index - 1] = answer
+        if any(answer is None for answer in answers):
+            return None
+        return answers
+
+    async def generate_batched(self, prompts: List[str], temperature: float = 0.3, batch_size: int = 4) -> List[OllamaResponse]:
+        """
+        Generate answers for multiple prompts with one HTTP call per group.
+
+        Groups of `batch_size` prompts are folded into a single structured
+        request asking the model for a JSON array of answers, cutting HTTP
+        and prompt-processing overhead proportionally. Any group whose
+        output fails to parse falls back to per-prompt generation, so this
+        is safe to use opportunistically.
+
+        Args:
+            prompts: List of input prompts
+            temperature: Temperature for generation
+            batch_size: Number of prompts folded into each request
+
+        Returns:
+            List of OllamaResponse objects in prompt order
+        """
+        batch_size = max(1, batch_size)
+        results: List[Optional[OllamaResponse]] = [None] * len(prompts)
+
+        logger.info(f"Batching {len(prompts)} prompts into structured requests of {batch_size} for model '{self.model}'")
+        for group_start in range(0, len(prompts), batch_size):
+            group = prompts[group_start:group_start + batch_size]
+            if len(group) == 1:
+                results[group_start] = await self.generate_async(group[0], temperature)
+                continue
+
+            response = await self.generate_async(self._build_batched_prompt(group), temperature)
+            answers = self._parse_batched_response(response.content, len(group))
+            if answers is None:
+                logger.warning(f"Batched response did not parse; retrying {len(group)} prompts individually")
+                for i, fallback in enumerate(await self.generate_multiple_async(group, temperature)):
+                    results[group_start + i] = fallback
+                continue
+            for i, answer in enumerate(answers):
+                results[group_start + i] = OllamaResponse(content=answer.strip(), model=response.model)
+
+        return results
 
     def get_model_info(self) -> Dict[str, Any]:
         """
@@ -246,18 +652,48 @@ class OllamaService:
         url = f"{self.base_url}/api/show"
         logger.info(f"Requesting model info for '{self.model}' from {url}")
         try:
-            response = requests.post(
+            response = self._sync_session.post(
                 url,
                 json={"name": self.model},
-                timeout=10
+                timeout=5
             )
             response.raise_for_status()
             logger.info(f"Successfully retrieved model info for '{self.model}'.")
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
             logger.error(f"Could not get model info for '{self.model}': {e}")
             return {"error": f"Could not get model info: {str(e)}"}
 
+    def warmup(self) -> bool:
+        """
+        Issue a minimal generation request so the model is loaded into memory.
+
+        Ollama unloads idle models; the first real request then pays a
+        multi-second model-load cost. A one-token generation at startup moves
+        that cost out of the user-visible path.
+
+        Returns:
+            True if the warm-up request succeeded, False otherwise
+        """
+        url = f"{self.base_url}/api/generate"
+        payload = {
+            "model": self.model,
+            "prompt": " ",
+            "stream": False,
+            "options": {"num_predict": 1}
+        }
+        logger.info(f"Warming up model '{self.model}' at {url}")
+        try:
+            response = self._sync_session.post(url, json=payload, timeout=(5, self.timeout))
+            if response.status_code == 200:
+                logger.info(f"Model '{self.model}' warmed up successfully.")
+                return True
+            logger.warning(f"Warm-up request for model '{self.model}' returned status {response.status_code}")
+            return False
+        except Exception as e:
+            logger.warning(f"Warm-up request for model '{self.model}' failed: {e}")
+            return False
+
     def pull_model(self) -> bool:
         """
         Pull the model if it's not available locally.
@@ -268,13 +704,15 @@ class OllamaService:
         url = f"{self.base_url}/api/pull"
         logger.info(f"Attempting to pull model '{self.model}' from {url}")
         try:
-            response = requests.post(
+            response = self._sync_session.post(
                 url,
                 json={"name": self.model},
-                timeout=600  # Model pulling can take a while
+                timeout=(5, 600)  # Model pulling can take a while
             )
             if response.status_code == 200:
                 logger.info(f"Successfully initiated pull for model '{self.model}'.")
+                # The model set just changed; drop the cached tag list
+                self._tags_cache = None
                 return True
             else:
                 logger.warning(f"Failed to pull model '{self.model}'. Status code: {response.status_code}")
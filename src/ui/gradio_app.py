@@ -1,5 +1,4 @@
 import gradio as gr
-import tempfile
 import os
 import logging
 from typing import Optional, Tuple, Dict, Any
@@ -16,6 +15,59 @@ log_level = getattr(logging, config_instance.log_level.upper(), logging.INFO)
 logging.basicConfig(level=log_level)
 logger = logging.getLogger(__name__)
 
+# Static interface strings live at module level so every
+# create_gradio_interface call reuses the same interned objects instead
+# of rebuilding them.
+_GRADIO_CSS: str = """
+.main-header {
+    text-align: center;
+    margin-bottom: 30px;
+}
+.status-box {
+    border-radius: 10px;
+    padding: 15px;
+    margin: 10px 0;
+}
+.success {
+    background-color: #d4edda;
+    border-color: #c3e6cb;
+    color: #155724;
+}
+.error {
+    background-color: #f8d7da;
+    border-color: #f5c6cb;
+    color: #721c24;
+}
+"""
+
+_HEADER_MARKDOWN = """
+# 🎯 Transcript Summarizer
+
+Upload your VTT transcript files and get AI-powered summaries using your chosen LLM provider (Ollama or Gemini).
+Handles long transcripts automatically with intelligent chunking.
+"""
+
+_TIPS_MARKDOWN = """
+## 💡 Tips
+
+- **VTT Format**: Upload WebVTT subtitle files (.vtt extension)
+- **Long Transcripts**: The system automatically handles transcripts longer than the model's context window
+- **Chunk Size**: Larger chunks = more context per summary, but may hit model limits
+- **Overlap**: Helps maintain continuity between chunks
+- **Temperature**: Lower values = more focused summaries, higher values = more creative
+
+## 🎬 Sample VTT Format
+```
+WEBVTT
+
+00:00:00.000 --> 00:00:03.000
+Welcome to our presentation on artificial intelligence.
+
+00:00:03.000 --> 00:00:07.000
+Today we'll discuss the latest developments in machine learning.
+```
+"""
+
 def create_gradio_interface(config: Config) -> gr.Interface:
     """
     Create and configure the Gradio interface for the transcript summarizer.
@@ -27,89 +79,87 @@ def create_gradio_interface(config: Config) -> gr.Interface:
         Configured Gradio interface
     """
     
-    # Initialize the summarizer
-    summarizer = TranscriptSummarizer(config)
+    # Defer summarizer construction (tokenizer load, warm-up thread) to the
+    # first real use so the UI boots and imports stay side-effect free.
+    _summarizer: Optional[TranscriptSummarizer] = None
+
+    def _get_summarizer() -> TranscriptSummarizer:
+        nonlocal _summarizer
+        if _summarizer is None:
+            _summarizer = TranscriptSummarizer(config)
+        return _summarizer
     
     async def process_vtt_file(
         file_obj,
         chunk_size: int,
         chunk_overlap: int,
         temperature: float
-    ) -> Tuple[str, str, str]:
+    ):
         """
-        Process uploaded VTT file and return summary with statistics.
-        
+        Process uploaded VTT file, streaming the summary as it is generated.
+
         Args:
-            file_obj: Uploaded file object
+            file_obj: Uploaded file path (gr.File uses type="filepath")
             chunk_size: Maximum tokens per chunk
             chunk_overlap: Overlap between chunks
             temperature: LLM temperature
-            
-        Returns:
-            Tuple of (summary, statistics, status_message)
+
+        Yields:
+            Tuples of (summary, statistics, status_message); the summary grows
+            as tokens arrive from the LLM
         """
         if file_obj is None:
-            return "", "", "❌ Please upload a VTT file."
-        
+            yield "", "", "❌ Please upload a VTT file."
+            return
+
         try:
             logger.info("🎬 GRADIO DEBUG: Starting VTT file processing")
             logger.info(f"🔧 GRADIO CONFIG DEBUG: Received from UI - chunk_size={chunk_size}, chunk_overlap={chunk_overlap}, temperature={temperature}")
-            
-            # Read file content
-            original_file_name_base = "uploaded_transcript" # Default name
-            if hasattr(file_obj, 'name'):
-                file_path = file_obj.name
-                original_file_name_base = os.path.splitext(os.path.basename(file_path))[0]
-                logger.info(f"📂 GRADIO DEBUG: Processing file at path: {file_path}, base name: {original_file_name_base}")
-            else:
-                # Handle case where file_obj is just the content
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.vtt', delete=False) as tmp_file:
-                    if isinstance(file_obj, str):
-                        tmp_file.write(file_obj)
-                    else:
-                        tmp_file.write(file_obj.read())
-                    file_path = tmp_file.name
-                logger.info(f"📂 GRADIO DEBUG: Created temporary file at: {file_path}")
-            
-            # Process the file with the provided configuration
+
+            # gr.File is configured with type="filepath", so the upload is
+            # already a path on disk; no tempfile copy is needed.
+            file_path = file_obj if isinstance(file_obj, str) else file_obj.name
+            original_file_name_base = os.path.splitext(os.path.basename(file_path))[0]
+            logger.info(f"📂 GRADIO DEBUG: Processing file at path: {file_path}, base name: {original_file_name_base}")
+
+            # Process the file with the provided configuration, streaming the
+            # final summary so the user sees tokens as they arrive.
             logger.info("🚀 GRADIO DEBUG: Calling summarizer with configuration from UI")
-            result = await summarizer.summarize_vtt_file(
-                file_path, 
+            yield "", "", "⏳ Summarizing chunks..."
+            async for item in _get_summarizer().summarize_vtt_file_stream(
+                file_path,
                 original_file_name_base=original_file_name_base,
-                chunk_size=chunk_size, 
-                chunk_overlap=chunk_overlap, 
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
                 temperature=temperature
-            )
-            
-            # Clean up temporary file if created
-            if hasattr(file_obj, 'name') and file_path != file_obj.name:
-                try:
-                    os.unlink(file_path)
-                    logger.info("🧹 GRADIO DEBUG: Cleaned up temporary file")
-                except:
-                    pass
-            
+            ):
+                if isinstance(item, SummarizationResult):
+                    result = item
+                    break
+                yield item, "", "⏳ Generating summary..."
+
             if result.error:
                 logger.error(f"❌ GRADIO DEBUG: Summarization error: {result.error}")
-                return "", "", f"❌ Error: {result.error}"
-            
+                yield "", "", f"❌ Error: {result.error}"
+                return
+
             # Format statistics
             stats = format_statistics(result)
-            
+
             # Success message
             status_msg = f"✅ Summary generated successfully! Processed {result.chunks_processed} chunks in {result.processing_time:.2f} seconds."
             logger.info(f"✅ GRADIO DEBUG: Processing completed successfully - {status_msg}")
-            
-            return result.summary, stats, status_msg
-            
+
+            yield result.summary, stats, status_msg
+
         except Exception as e:
             logger.error(f"❌ GRADIO DEBUG: Exception in process_vtt_file: {str(e)}")
-            return "", "", f"❌ Error processing file: {str(e)}"
+            yield "", "", f"❌ Error processing file: {str(e)}"
     
-    def check_system_health() -> str:
+    async def check_system_health() -> str:
         """Check system health and return status."""
         try:
-            health = summarizer.check_service_health()
+            health = await _get_summarizer().check_service_health()
             
             status_lines = ["## System Health Check", ""]
             
@@ -189,39 +239,11 @@ def create_gradio_interface(config: Config) -> gr.Interface:
     with gr.Blocks(
         title="Transcript Summarizer",
         theme=gr.themes.Soft(),
-        css="""
-        .main-header {
-            text-align: center;
-            margin-bottom: 30px;
-        }
-        .status-box {
-            border-radius: 10px;
-            padding: 15px;
-            margin: 10px 0;
-        }
-        .success {
-            background-color: #d4edda;
-            border-color: #c3e6cb;
-            color: #155724;
-        }
-        .error {
-            background-color: #f8d7da;
-            border-color: #f5c6cb;
-            color: #721c24;
-        }
-        """
+        css=_GRADIO_CSS
     ) as interface:
         
         # Header
-        gr.Markdown(
-            """
-            # 🎯 Transcript Summarizer
-            
-            Upload your VTT transcript files and get AI-powered summaries using your chosen LLM provider (Ollama or Gemini).
-            Handles long transcripts automatically with intelligent chunking.
-            """,
-            elem_classes=["main-header"]
-        )
+        gr.Markdown(_HEADER_MARKDOWN, elem_classes=["main-header"])
         
         with gr.Row():
             with gr.Column(scale=2):
@@ -314,28 +336,7 @@ def create_gradio_interface(config: Config) -> gr.Interface:
                         )
         
         # Example section
-        gr.Markdown(
-            """
-            ## 💡 Tips
-            
-            - **VTT Format**: Upload WebVTT subtitle files (.vtt extension)
-            - **Long Transcripts**: The system automatically handles transcripts longer than the model's context window
-            - **Chunk Size**: Larger chunks = more context per summary, but may hit model limits
-            - **Overlap**: Helps maintain continuity between chunks
-            - **Temperature**: Lower values = more focused summaries, higher values = more creative
-            
-            ## 🎬 Sample VTT Format
-            ```
-            WEBVTT
-            
-            00:00:00.000 --> 00:00:03.000
-            Welcome to our presentation on artificial intelligence.
-            
-            00:00:03.000 --> 00:00:07.000
-            Today we'll discuss the latest developments in machine learning.
-            ```
-            """
-        )
+        gr.Markdown(_TIPS_MARKDOWN)
         
         # Event handlers
         summarize_btn.click(
@@ -357,7 +358,7 @@ def create_gradio_interface(config: Config) -> gr.Interface:
 
         # Update summarizer config when LLM provider changes
         llm_provider_input.change(
-            fn=lambda provider: summarizer._initialize_llm_service(Config(llm_provider=provider)),
+            fn=lambda provider: _get_summarizer()._initialize_llm_service(Config(llm_provider=provider)),
             inputs=[llm_provider_input],
             outputs=[]
         )
@@ -1,98 +1,102 @@
 import os
+from dataclasses import dataclass, field
+from functools import partial
 from typing import Optional
-try:
-    from pydantic import BaseSettings, Field
-except ImportError:
-    from pydantic_settings import BaseSettings
-    from pydantic import Field
-
-class Config(BaseSettings):
-    """Configuration management for the transcript summarizer application."""
-    
+
+def _load_env_file(path: str = ".env") -> None:
+    """
+    Load KEY=VALUE pairs from a .env file into os.environ.
+
+    Real environment variables win over file values; comments and blank
+    lines are skipped. This replaces pydantic's env_file support without
+    pulling in the validator machinery at import time.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#") or "=" not in line:
+                    continue
+                key, _, value = line.partition("=")
+                os.environ.setdefault(key.strip(), value.strip().strip("'\""))
+    except OSError:
+        pass
+
+_load_env_file()
+
+def _env_str(name: str, default: Optional[str]) -> Optional[str]:
+    """Read a string env var, falling back to the default."""
+    return os.environ.get(name, default)
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer env var, falling back to the default."""
+    value = os.environ.get(name)
+    return int(value) if value is not None else default
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float env var, falling back to the default."""
+    value = os.environ.get(name)
+    return float(value) if value is not None else default
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean env var ("1"/"true"/"yes"/"on"), falling back to the default."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+@dataclass(slots=True)
+class Config:
+    """Configuration management for the transcript summarizer application.
+
+    Each field reads its environment variable at instantiation time via a
+    default factory, so `Config()` picks up the environment (and .env file)
+    while explicit keyword arguments still override it — without the
+    import-time cost of pydantic's validation machinery.
+    """
+
     # Provider Configuration
-    llm_provider: str = Field(
-        default="ollama",
-        env="LLM_PROVIDER",
-        description="LLM provider to use (e.g., 'ollama', 'gemini')"
-    )
+    llm_provider: str = field(default_factory=partial(_env_str, "LLM_PROVIDER", "ollama"))
 
     # Ollama Configuration
-    ollama_base_url: str = Field(
-        default="http://localhost:11434",
-        env="OLLAMA_BASE_URL",
-        description="Base URL for Ollama API"
-    )
-    
-    ollama_model_name: str = Field(
-        default="llama3.1:8b",
-        env="OLLAMA_MODEL_NAME",
-        description="Name of the Ollama model to use"
-    )
+    ollama_base_url: str = field(default_factory=partial(_env_str, "OLLAMA_BASE_URL", "http://localhost:11434"))
+    ollama_model_name: str = field(default_factory=partial(_env_str, "OLLAMA_MODEL_NAME", "llama3.1:8b"))
+    ollama_num_parallel: int = field(default_factory=partial(_env_int, "OLLAMA_NUM_PARALLEL", 4))
 
     # Gemini Configuration
-    gemini_api_key: Optional[str] = Field(
-        default=None,
-        env="GEMINI_API_KEY",
-        description="API key for Google Gemini"
-    )
-
-    gemini_model_name: str = Field(
-        default="gemini-2.5-flash",
-        env="GEMINI_MODEL_NAME",
-        description="Name of the Gemini model to use"
-    )
-    
+    gemini_api_key: Optional[str] = field(default_factory=partial(_env_str, "GEMINI_API_KEY", None))
+    gemini_model_name: str = field(default_factory=partial(_env_str, "GEMINI_MODEL_NAME", "gemini-2.5-flash"))
+
     # Chunking Configuration
-    chunk_size: int = Field(
-        default=2000,
-        env="CHUNK_SIZE",
-        description="Maximum tokens per chunk"
-    )
-    
-    chunk_overlap: int = Field(
-        default=200,
-        env="CHUNK_OVERLAP",
-        description="Token overlap between chunks"
-    )
-    
+    chunk_size: int = field(default_factory=partial(_env_int, "CHUNK_SIZE", 2000))
+    chunk_overlap: int = field(default_factory=partial(_env_int, "CHUNK_OVERLAP", 200))
+
     # Gradio Configuration
-    gradio_port: int = Field(
-        default=7860,
-        env="GRADIO_PORT",
-        description="Port for Gradio server"
-    )
-    
+    gradio_port: int = field(default_factory=partial(_env_int, "GRADIO_PORT", 7860))
+
     # Processing Configuration
-    max_concurrent_requests: int = Field(
-        default=3,
-        env="MAX_CONCURRENT_REQUESTS",
-        description="Maximum concurrent API requests"
-    )
-    
-    request_timeout: int = Field(
-        default=300,
-        env="REQUEST_TIMEOUT",
-        description="Request timeout in seconds"
-    )
-    
+    fuse_threshold: int = field(default_factory=partial(_env_int, "FUSE_THRESHOLD", 4))
+    merge_fanout: int = field(default_factory=partial(_env_int, "MERGE_FANOUT", 4))
+    min_summarize_chars: int = field(default_factory=partial(_env_int, "MIN_SUMMARIZE_CHARS", 500))
+    min_chunks_for_final_merge: int = field(default_factory=partial(_env_int, "MIN_CHUNKS_FOR_FINAL_MERGE", 2))
+    max_concurrent_requests: int = field(default_factory=partial(_env_int, "MAX_CONCURRENT_REQUESTS", 3))
+    batch_prompts: bool = field(default_factory=partial(_env_bool, "BATCH_PROMPTS", False))
+    batch_size: int = field(default_factory=partial(_env_int, "BATCH_SIZE", 4))
+    warmup_on_start: bool = field(default_factory=partial(_env_bool, "WARMUP_ON_START", True))
+    redis_url: Optional[str] = field(default_factory=partial(_env_str, "REDIS_URL", None))
+    chunk_cache_ttl: int = field(default_factory=partial(_env_int, "CHUNK_CACHE_TTL", 86400))
+    request_timeout: int = field(default_factory=partial(_env_int, "REQUEST_TIMEOUT", 300))
+
     # Temperature for LLM
-    temperature: float = Field(
-        default=0.3,
-        env="TEMPERATURE",
-        description="Temperature for text generation"
-    )
-    
+    temperature: float = field(default_factory=partial(_env_float, "TEMPERATURE", 0.3))
+
     # Logging Configuration
-    log_level: str = Field(
-        default="INFO",
-        env="LOG_LEVEL",
-        description="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)"
-    )
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+    log_level: str = field(default_factory=partial(_env_str, "LOG_LEVEL", "INFO"))
+
+    @classmethod
+    def from_env(cls) -> "Config":
+        """Build a Config from the current environment."""
+        return cls()
 
 # Global config instance
-config = Config()
+config = Config.from_env()
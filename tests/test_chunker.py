@@ -30,6 +30,18 @@ class TestTextChunker:
         assert len(chunks) > 0
         assert all(chunk.token_count <= self.chunker.chunk_size for chunk in chunks)
     
+    def test_chunk_recursive(self):
+        """Test recursive paragraph/sentence/word chunking."""
+        chunks = self.chunker.chunk_recursive(self.sample_text)
+
+        assert len(chunks) > 0
+        assert all(isinstance(chunk, TextChunk) for chunk in chunks)
+        assert all(chunk.token_count <= self.chunker.chunk_size for chunk in chunks)
+
+    def test_chunk_recursive_empty(self):
+        """Test recursive chunking of empty text."""
+        assert self.chunker.chunk_recursive("") == []
+
     def test_short_text(self):
         """Test chunking of short text that fits in one chunk."""
         short_text = "This is a short text."
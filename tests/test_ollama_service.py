@@ -1,4 +1,7 @@
+import json
+
 import pytest
+import requests
 from unittest.mock import Mock, patch
 from src.services.ollama_service import OllamaService, OllamaResponse
 
@@ -13,17 +16,18 @@ class TestOllamaService:
             timeout=30
         )
     
-    @patch('src.services.ollama_service.requests.get')
+    @patch('src.services.ollama_service.requests.Session.get')
     def test_test_connection_success(self, mock_get):
         """Test successful connection test."""
         mock_response = Mock()
         mock_response.status_code = 200
+        mock_response.content = json.dumps({"models": []}).encode()
         mock_get.return_value = mock_response
         
         result = self.service.test_connection()
         assert result is True
     
-    @patch('src.services.ollama_service.requests.get')
+    @patch('src.services.ollama_service.requests.Session.get')
     def test_test_connection_failure(self, mock_get):
         """Test failed connection test."""
         mock_get.side_effect = Exception("Connection failed")
@@ -31,33 +35,37 @@ class TestOllamaService:
         result = self.service.test_connection()
         assert result is False
     
-    @patch('src.services.ollama_service.requests.get')
+    @patch('src.services.ollama_service.requests.Session.get')
     def test_check_model_availability(self, mock_get):
         """Test model availability check."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "models": [
                 {"name": "llama3.1:8b:latest"},
                 {"name": "other-model:latest"}
             ]
-        }
+        }).encode()
         mock_get.return_value = mock_response
         
         result = self.service.check_model_availability()
         assert result is True
     
-    @patch('src.services.ollama_service.requests.post')
+    @patch('src.services.ollama_service.requests.Session.post')
     def test_generate_sync_success(self, mock_post):
         """Test successful synchronous generation."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "response": "This is a test response",
-            "model": "llama3.1:8b",
-            "total_duration": 1000000,
-            "eval_count": 10
-        }
+        mock_response.iter_lines.return_value = [
+            json.dumps({"response": "This is a ", "done": False}).encode(),
+            json.dumps({
+                "response": "test response",
+                "model": "llama3.1:8b",
+                "total_duration": 1000000,
+                "eval_count": 10,
+                "done": True
+            }).encode()
+        ]
         mock_post.return_value = mock_response
         
         result = self.service.generate_sync("Test prompt")
@@ -66,12 +74,38 @@ class TestOllamaService:
         assert result.content == "This is a test response"
         assert result.model == "llama3.1:8b"
     
-    @patch('src.services.ollama_service.requests.post')
+    @patch('src.services.ollama_service.requests.Session.post')
     def test_generate_sync_failure(self, mock_post):
         """Test failed synchronous generation."""
-        mock_post.side_effect = Exception("API Error")
+        mock_post.side_effect = requests.exceptions.RequestException("API Error")
         
         with pytest.raises(Exception) as exc_info:
             self.service.generate_sync("Test prompt")
         
         assert "Error communicating with Ollama" in str(exc_info.value)
+    
+    def test_parse_batched_response_success(self):
+        """Test parsing a well-formed batched JSON response."""
+        content = 'Here are the answers:\n[{"index": 1, "answer": "First summary"}, {"index": 2, "answer": "Second summary"}]'
+        
+        answers = self.service._parse_batched_response(content, expected=2)
+        assert answers == ["First summary", "Second summary"]
+    
+    def test_parse_batched_response_out_of_order(self):
+        """Test that answers are reordered by their task index."""
+        content = '[{"index": 2, "answer": "Second"}, {"index": 1, "answer": "First"}]'
+        
+        answers = self.service._parse_batched_response(content, expected=2)
+        assert answers == ["First", "Second"]
+    
+    def test_parse_batched_response_malformed(self):
+        """Test that unparseable or mismatched output returns None."""
+        # No JSON array at all
+        assert self.service._parse_batched_response("I cannot do that.", expected=2) is None
+        # Invalid JSON inside the brackets
+        assert self.service._parse_batched_response('[{"index": 1,]', expected=1) is None
+        # Wrong number of answers
+        content = '[{"index": 1, "answer": "Only one"}]'
+        assert self.service._parse_batched_response(content, expected=2) is None
+        # Non-string answer
+        assert self.service._parse_batched_response('[{"index": 1, "answer": 42}]', expected=1) is None